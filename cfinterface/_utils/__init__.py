@@ -1,12 +1,37 @@
 import math
+import struct
+from datetime import date, datetime
 from typing import Any
 
+import numpy as np  # type: ignore[import-untyped]
+
+_STRUCT_CODES = {
+    ("i", 1): "b",
+    ("i", 2): "h",
+    ("i", 4): "i",
+    ("i", 8): "q",
+    ("u", 1): "B",
+    ("u", 2): "H",
+    ("u", 4): "I",
+    ("u", 8): "Q",
+    ("f", 2): "e",
+    ("f", 4): "f",
+    ("f", 8): "d",
+}
+
+
+_NEVER_NULL_TYPES = frozenset([str, bytes, int, bool, date, datetime])
+
 
 def _is_null(value: Any) -> bool:
     """Return True if value is None, NaN, or a datetime-like null
     (e.g. pandas.NaT)."""
     if value is None:
         return True
+    # The common value types are never null, and are answered without
+    # the exception and strftime checks below
+    if type(value) in _NEVER_NULL_TYPES:
+        return False
     try:
         return math.isnan(value)
     except (TypeError, ValueError):
@@ -21,3 +46,21 @@ def _is_null(value: Any) -> bool:
         except (ValueError, AttributeError, TypeError):
             return True
     return False
+
+
+_struct_cache: dict[Any, struct.Struct] = {}
+
+
+def _dtype_struct(dtype: Any) -> struct.Struct:
+    """Return a struct.Struct that packs and unpacks a single scalar
+    with the same layout of the given numpy dtype. The Struct objects
+    are shared by all fields with the same dtype."""
+    packer = _struct_cache.get(dtype)
+    if packer is None:
+        dt = np.dtype(dtype)
+        byteorder = "=" if dt.byteorder in ("=", "|") else dt.byteorder
+        packer = struct.Struct(
+            byteorder + _STRUCT_CODES[(dt.kind, dt.itemsize)]
+        )
+        _struct_cache[dtype] = packer
+    return packer
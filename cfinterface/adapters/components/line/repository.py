@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
 from typing import Any, Literal, Union, overload
 
+import numpy as np  # type: ignore[import-untyped]
+
 from cfinterface.components.field import Field
 from cfinterface.storage import StorageType
 
 
 class Repository(ABC):
+    __slots__ = ["_fields"]
+
     def __init__(
         self, fields: list[Field], values: list[Any] | None = None
     ) -> None:
@@ -22,6 +26,50 @@ class Repository(ABC):
     def write(self, values: list[Any], delimiter: str | bytes | None) -> Any:
         raise NotImplementedError
 
+    def read_many(
+        self, lines: list[Any], delimiter: str | bytes | None = None
+    ) -> list[list[Any]]:
+        return [self.read(line, delimiter) for line in lines]
+
+    def write_many(
+        self, rows: list[list[Any]], delimiter: str | bytes | None = None
+    ) -> list[Any]:
+        write = self.write
+        return [write(values, delimiter) for values in rows]
+
+    def _write_fields(self, empty: Any) -> Any:
+        """
+        Builds a line with the current field values, joining all the
+        formatted values once instead of rebuilding the line for every
+        field. Falls back to Field.write when a field starts before
+        the end of the previous one (overlapping, unsorted or
+        overflowing fields), which keeps the same output.
+        """
+        binary = isinstance(empty, bytes)
+        space = b" " if binary else " "
+        parts: list[Any] = []
+        append = parts.append
+        length = 0
+        for i, field in enumerate(self._fields):
+            start = field._starting_position
+            if start < length:
+                line = empty.join(parts)
+                for remaining in self._fields[i:]:
+                    line = remaining.write(line)
+                return line
+            value = field._binary_write() if binary else field._textual_write()
+            if start > length:
+                append(space * (start - length))
+            append(value)
+            length = start + len(value)
+        return empty.join(parts)
+
+    def _read_columns(self, lines: list[Any]) -> list[list[Any]]:
+        if len(self._fields) == 0:
+            return [[] for _ in lines]
+        columns = [field.read_many(lines) for field in self._fields]
+        return [list(row) for row in zip(*columns, strict=True)]
+
     @property
     def fields(self) -> list[Field]:
         return self._fields
@@ -41,22 +89,26 @@ class Repository(ABC):
 
 
 class TextualRepository(Repository):
+    __slots__: list[str] = []
+
     def __positional_to_delimited_field(self, f: Field) -> Field:
-        f.ending_position = f.size
-        f.starting_position = 0
+        if f._starting_position != 0 or f._ending_position != f._size:
+            f.ending_position = f.size
+            f.starting_position = 0
         return f
 
     def __positional_reading(self, line: str) -> list[Any]:
-        for field in self._fields:
-            field.read(line)
-        return self.values
+        return [field._read_str(line) for field in self._fields]
 
     def __delimted_reading(self, line: str, delimiter: str) -> list[Any]:
-        fields = [self.__positional_to_delimited_field(f) for f in self._fields]
-        values = [v.strip() for v in line.split(delimiter)]
-        for field, value in zip(fields, values, strict=False):
-            field.read(value)
-        return self.values
+        tokens = line.split(delimiter)
+        values = [
+            self.__positional_to_delimited_field(field)._read_str(token.strip())
+            for field, token in zip(self._fields, tokens, strict=False)
+        ]
+        # Fields without a matching token keep their previous values
+        values.extend(f.value for f in self._fields[len(values) :])
+        return values
 
     def read(
         self,
@@ -68,17 +120,46 @@ class TextualRepository(Repository):
             return self.__delimted_reading(line_str, delimiter)
         return self.__positional_reading(line_str)
 
+    def read_many(
+        self, lines: list[Any], delimiter: str | bytes | None = None
+    ) -> list[list[Any]]:
+        if isinstance(delimiter, str):
+            return self.__delimited_read_many(lines, delimiter)
+        return self._read_columns(
+            [
+                line if isinstance(line, str) else line.decode("utf-8")
+                for line in lines
+            ]
+        )
+
+    def __delimited_read_many(
+        self, lines: list[Any], delimiter: str
+    ) -> list[list[Any]]:
+        rows = [
+            (line if isinstance(line, str) else line.decode("utf-8")).split(
+                delimiter
+            )
+            for line in lines
+        ]
+        n_fields = len(self._fields)
+        if n_fields == 0 or any(len(row) < n_fields for row in rows):
+            return super().read_many(lines, delimiter)
+        columns = [
+            self.__positional_to_delimited_field(field).read_many(
+                [row[i].strip() for row in rows]
+            )
+            for i, field in enumerate(self._fields)
+        ]
+        return [list(values) for values in zip(*columns, strict=True)]
+
     def __positional_writing(self, values: list[Any]) -> str:
-        line = ""
         self.values = values
-        for field in self._fields:
-            line = field.write(line)
-        return line + "\n"
+        return self._write_fields("") + "\n"  # type: ignore[no-any-return]
 
     def __delimted_writing(self, values: list[Any], delimiter: str) -> str:
         fields = [self.__positional_to_delimited_field(f) for f in self._fields]
         self.values = values
-        separated = [field.write("").strip() for field in fields]
+        separated = [field._format_value() for field in fields]
         return delimiter.join(separated) + "\n"
 
     def write(
@@ -90,6 +171,8 @@ class TextualRepository(Repository):
 
 
 class BinaryRepository(Repository):
+    __slots__: list[str] = []
+
     def read(
         self,
         line: Any,
@@ -98,18 +181,52 @@ class BinaryRepository(Repository):
         line_bytes: bytes = (
             line if isinstance(line, bytes) else line.encode("utf-8")
         )
-        for field in self._fields:
-            field.read(line_bytes)  # type: ignore[arg-type]
-        return self.values
+        return [field._read_bytes(line_bytes) for field in self._fields]
+
+    def read_many(
+        self, lines: list[Any], delimiter: str | bytes | None = None
+    ) -> list[list[Any]]:
+        lines_bytes = [
+            line if isinstance(line, bytes) else line.encode("utf-8")
+            for line in lines
+        ]
+        dtypes = [f._binary_dtype() for f in self._fields]
+        length = len(lines_bytes[0]) if len(lines_bytes) > 0 else 0
+        if (
+            len(self._fields) == 0
+            or any(
+                dtype is None
+                or np.dtype(dtype).itemsize != field.size
+                or field.ending_position > length
+                for dtype, field in zip(dtypes, self._fields, strict=True)
+            )
+            or any(len(line) != length for line in lines_bytes)
+        ):
+            return self._read_columns(lines_bytes)
+        # All records have the same size and all fields are numeric:
+        # each field is read for all records at once, reinterpreting
+        # its column of bytes with the field dtype.
+        records = np.frombuffer(b"".join(lines_bytes), dtype=np.uint8)
+        records = records.reshape(len(lines_bytes), length)
+        columns = []
+        for dtype, field in zip(dtypes, self._fields, strict=True):
+            column = np.ascontiguousarray(records[:, field._slice])
+            values = column.view(dtype).ravel().tolist()
+            field.value = values[-1]
+            columns.append(values)
+        return [list(row) for row in zip(*columns, strict=True)]
 
     def write(
         self, values: list[Any], delimiter: str | bytes | None = None
     ) -> bytes:
-        line = b""
         self.values = values
-        for field in self._fields:
-            line = field.write(line)
-        return line
+        return self._write_fields(b"")  # type: ignore[no-any-return]
+
+
+_MAPPINGS: dict[str | StorageType, type[Repository]] = {
+    StorageType.TEXT: TextualRepository,
+    StorageType.BINARY: BinaryRepository,
+}
 
 
 @overload
@@ -125,8 +242,4 @@ def factory(kind: str | StorageType) -> type[Repository]: ...
 
 
 def factory(kind: Union[str, "StorageType"]) -> type[Repository]:
-    mappings: dict[str | StorageType, type[Repository]] = {
-        StorageType.TEXT: TextualRepository,
-        StorageType.BINARY: BinaryRepository,
-    }
-    return mappings.get(kind, TextualRepository)
+    return _MAPPINGS.get(kind, TextualRepository)
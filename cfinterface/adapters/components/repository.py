@@ -15,6 +15,98 @@ def _compile(pattern: str | bytes) -> "re.Pattern[Any]":
     return compiled
 
 
+_typed_pattern_cache: dict[tuple[str | bytes, bool], "re.Pattern[Any]"] = {}
+
+
+def _compile_typed(pattern: str | bytes, binary: bool) -> "re.Pattern[Any]":
+    """
+    Compiles a pattern as a bytes regex (``binary=True``) or as a str
+    regex, converting the pattern with utf-8 when needed. The conversion
+    is done only once per (pattern, kind) pair.
+    """
+    key = (pattern, binary)
+    compiled = _typed_pattern_cache.get(key)
+    if compiled is None:
+        if binary and isinstance(pattern, str):
+            compiled = _compile(pattern.encode("utf-8"))
+        elif not binary and isinstance(pattern, bytes):
+            compiled = _compile(pattern.decode("utf-8"))
+        else:
+            compiled = _compile(pattern)
+        _typed_pattern_cache[key] = compiled
+    return compiled
+
+
+_Pattern = re.Pattern
+
+_REGEX_METACHARACTERS = frozenset("\\.^$*+?{}[]|()")
+
+
+def _is_literal(pattern: str | bytes) -> bool:
+    chars = pattern.decode("latin-1") if isinstance(pattern, bytes) else pattern
+    return _REGEX_METACHARACTERS.isdisjoint(chars)
+
+
+_matcher_cache: dict[bool, dict[str | bytes, Any]] = {False: {}, True: {}}
+
+
+def _search(pattern: str | bytes, line: Any, binary: bool) -> bool:
+    """
+    Tells if the pattern is found in a given line, with the same
+    semantics of ``re.search``, searching a bytes line when ``binary``
+    is set and a str line otherwise. Literal patterns searched in str
+    lines, which are the most common case for markers and identifiers,
+    are checked with a substring test instead of the regex engine.
+    """
+    matcher = _matcher_cache[binary].get(pattern)
+    if matcher is None:
+        # Substring tests on bytes are slower than the regex engine for
+        # short lines, so only str literals take the fast path.
+        if binary or not _is_literal(pattern):
+            matcher = _compile_typed(pattern, binary)
+        elif isinstance(pattern, bytes):
+            matcher = pattern.decode("utf-8")
+        else:
+            matcher = pattern
+        _matcher_cache[binary][pattern] = matcher
+    if isinstance(matcher, _Pattern):
+        return matcher.search(line) is not None
+    return matcher in line
+
+
+class MultiPatternRepository:
+    """
+    Finds the first of many patterns that is found in a line, with the
+    same result of calling ``search`` for each pattern in order. The
+    patterns are converted and compiled once, and when all of them are
+    str literals, they are looked up with substring searches, which are
+    much cheaper than the regex engine.
+    """
+
+    __slots__ = ["_compiled", "_literals"]
+
+    def __init__(self, patterns: list[str | bytes], binary: bool) -> None:
+        # An alternation of all patterns was measured as much slower
+        # than searching each compiled pattern, since it loses the
+        # literal prefix scan that re does for each pattern alone.
+        self._compiled = [_compile_typed(p, binary) for p in patterns]
+        self._literals: list[Any] | None = None
+        typed = [c.pattern for c in self._compiled]
+        if not binary and all(_is_literal(p) for p in typed):
+            self._literals = typed
+
+    def first_match(self, line: str | bytes) -> int | None:
+        if self._literals is not None:
+            for i, literal in enumerate(self._literals):
+                if literal in line:
+                    return i
+            return None
+        for i, compiled in enumerate(self._compiled):
+            if compiled.search(line) is not None:
+                return i
+        return None
+
+
 class Repository(ABC):
     @staticmethod
     @abstractmethod
@@ -43,28 +135,36 @@ class Repository(ABC):
 
 
 class BinaryRepository(Repository):
+    # The searches are attempted on the line as given, and a str line
+    # only raises TypeError, and is encoded, in the uncommon case.
     @staticmethod
     def matches(pattern: str | bytes, line: str | bytes) -> bool:
-        line_bytes = line if isinstance(line, bytes) else line.encode("utf-8")
-        if isinstance(pattern, bytes):
-            return _compile(pattern).search(line_bytes) is not None
-        return _compile(pattern).search(line_bytes.decode("utf-8")) is not None
+        # str patterns are encoded once and searched in the raw bytes,
+        # instead of decoding every line.
+        compiled = (
+            _compile(pattern)
+            if isinstance(pattern, bytes)
+            else _compile_typed(pattern, True)
+        )
+        try:
+            return compiled.search(line) is not None
+        except TypeError:
+            line = line.encode("utf-8")  # type: ignore[union-attr]
+            return compiled.search(line) is not None
 
     @staticmethod
     def begins(pattern: str | bytes, line: str | bytes) -> bool:
-        line_bytes = line if isinstance(line, bytes) else line.encode("utf-8")
-        pat_bytes = (
-            pattern if isinstance(pattern, bytes) else pattern.encode("utf-8")
-        )
-        return _compile(pat_bytes).search(line_bytes) is not None
+        try:
+            return _search(pattern, line, True)
+        except TypeError:
+            return _search(pattern, line.encode("utf-8"), True)  # type: ignore[union-attr]
 
     @staticmethod
     def ends(pattern: str | bytes, line: str | bytes) -> bool:
-        line_bytes = line if isinstance(line, bytes) else line.encode("utf-8")
-        pat_bytes = (
-            pattern if isinstance(pattern, bytes) else pattern.encode("utf-8")
-        )
-        return _compile(pat_bytes).search(line_bytes) is not None
+        try:
+            return _search(pattern, line, True)
+        except TypeError:
+            return _search(pattern, line.encode("utf-8"), True)  # type: ignore[union-attr]
 
     @staticmethod
     def read(file: IO[Any], linesize: int) -> bytes:
@@ -76,29 +176,28 @@ class BinaryRepository(Repository):
 
 
 class TextualRepository(Repository):
+    # The searches are attempted on the line as given, and a bytes line
+    # only raises TypeError, and is decoded, in the uncommon case.
     @staticmethod
     def matches(pattern: str | bytes, line: str | bytes) -> bool:
-        line_str = line if isinstance(line, str) else line.decode("utf-8")
-        pat_str = (
-            pattern if isinstance(pattern, str) else pattern.decode("utf-8")
-        )
-        return _compile(pat_str).search(line_str) is not None
+        try:
+            return _search(pattern, line, False)
+        except TypeError:
+            return _search(pattern, line.decode("utf-8"), False)  # type: ignore[union-attr]
 
     @staticmethod
     def begins(pattern: str | bytes, line: str | bytes) -> bool:
-        line_str = line if isinstance(line, str) else line.decode("utf-8")
-        pat_str = (
-            pattern if isinstance(pattern, str) else pattern.decode("utf-8")
-        )
-        return _compile(pat_str).search(line_str) is not None
+        try:
+            return _search(pattern, line, False)
+        except TypeError:
+            return _search(pattern, line.decode("utf-8"), False)  # type: ignore[union-attr]
 
     @staticmethod
     def ends(pattern: str | bytes, line: str | bytes) -> bool:
-        line_str = line if isinstance(line, str) else line.decode("utf-8")
-        pat_str = (
-            pattern if isinstance(pattern, str) else pattern.decode("utf-8")
-        )
-        return _compile(pat_str).search(line_str) is not None
+        try:
+            return _search(pattern, line, False)
+        except TypeError:
+            return _search(pattern, line.decode("utf-8"), False)  # type: ignore[union-attr]
 
     @staticmethod
     def read(file: IO[Any], linesize: int) -> str:
@@ -109,6 +208,12 @@ class TextualRepository(Repository):
         return file.write(data)  # type: ignore[no-any-return]
 
 
+_MAPPINGS: dict[str | StorageType, type[Repository]] = {
+    StorageType.TEXT: TextualRepository,
+    StorageType.BINARY: BinaryRepository,
+}
+
+
 @overload
 def factory(kind: Literal["TEXT"]) -> type[TextualRepository]: ...
 
@@ -122,8 +227,4 @@ def factory(kind: str | StorageType) -> type[Repository]: ...
 
 
 def factory(kind: Union[str, "StorageType"]) -> type[Repository]:
-    mappings: dict[str | StorageType, type[Repository]] = {
-        StorageType.TEXT: TextualRepository,
-        StorageType.BINARY: BinaryRepository,
-    }
-    return mappings.get(kind, TextualRepository)
+    return _MAPPINGS.get(kind, TextualRepository)
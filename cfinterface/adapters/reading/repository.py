@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from io import BytesIO, StringIO
+from os.path import getsize
 from typing import (
     IO,
     Any,
@@ -12,6 +13,12 @@ from typing import (
 
 from cfinterface.storage import StorageType
 
+# Files up to this size, in bytes, are read into memory when entering
+# the repository, since seek() and tell() on a memory buffer are much
+# cheaper than on a file. Larger files are streamed from disk, because
+# a StringIO can keep up to 4 bytes per character of text.
+_MAX_IN_MEMORY_SIZE = 64 * 1024 * 1024
+
 
 class Repository(ABC):
     __slots__ = ["_content", "_wrap_io"]
@@ -48,11 +55,13 @@ class BinaryRepository(Repository):
         self._filepointer: BinaryIO = None  # type: ignore[assignment]
 
     def __enter__(self) -> "BinaryRepository":
-        self._filepointer = (
-            BytesIO(self._content)  # type: ignore[arg-type]
-            if self._wrap_io
-            else open(self._content, "rb")  # type: ignore[arg-type]
-        )
+        if self._wrap_io:
+            self._filepointer = BytesIO(self._content)  # type: ignore[arg-type]
+        elif getsize(self._content) > _MAX_IN_MEMORY_SIZE:
+            self._filepointer = open(self._content, "rb")  # type: ignore[arg-type]
+        else:
+            with open(self._content, "rb") as fp:  # type: ignore[arg-type]
+                self._filepointer = BytesIO(fp.read())
         super().__enter__()
         return self
 
@@ -63,6 +72,33 @@ class BinaryRepository(Repository):
     def read(self, n: int) -> bytes:
         return self._filepointer.read(n)
 
+    def read_many(
+        self, offsets_and_sizes: list[tuple[int, int]]
+    ) -> list[bytes]:
+        """
+        Reads many chunks of the file, given by their offsets and
+        sizes, without changing the current position. Chunks that go
+        beyond the end of the file are returned with fewer bytes.
+
+        :param offsets_and_sizes: The offset and size of each chunk
+        :type offsets_and_sizes: list[tuple[int, int]]
+        :return: The bytes of each chunk
+        :rtype: list[bytes]
+        """
+        if not isinstance(self._filepointer, BytesIO):
+            position = self._filepointer.tell()
+            chunks = []
+            for offset, size in offsets_and_sizes:
+                self._filepointer.seek(offset)
+                chunks.append(self._filepointer.read(size))
+            self._filepointer.seek(position)
+            return chunks
+        with self._filepointer.getbuffer() as view:
+            return [
+                bytes(view[offset : offset + size])
+                for offset, size in offsets_and_sizes
+            ]
+
     @property
     def file(self) -> BinaryIO:
         return self._filepointer
@@ -83,11 +119,13 @@ class TextualRepository(Repository):
         self._filepointer: TextIO = None  # type: ignore[assignment]
 
     def __enter__(self) -> "TextualRepository":
-        self._filepointer = (
-            StringIO(self._content)  # type: ignore[arg-type]
-            if self._wrap_io
-            else open(self._content, encoding=self._encoding)  # type: ignore[arg-type]
-        )
+        if self._wrap_io:
+            self._filepointer = StringIO(self._content)  # type: ignore[arg-type]
+        elif getsize(self._content) > _MAX_IN_MEMORY_SIZE:
+            self._filepointer = open(self._content, encoding=self._encoding)  # type: ignore[arg-type]
+        else:
+            with open(self._content, encoding=self._encoding) as fp:  # type: ignore[arg-type]
+                self._filepointer = StringIO(fp.read())
         super().__enter__()
         return self
 
@@ -103,6 +141,12 @@ class TextualRepository(Repository):
         return self._filepointer
 
 
+_MAPPINGS: dict[str | StorageType, type[Repository]] = {
+    StorageType.TEXT: TextualRepository,
+    StorageType.BINARY: BinaryRepository,
+}
+
+
 @overload
 def factory(kind: Literal["TEXT"]) -> type[TextualRepository]: ...
 
@@ -116,8 +160,4 @@ def factory(kind: str | StorageType) -> type[Repository]: ...
 
 
 def factory(kind: Union[str, "StorageType"]) -> type[Repository]:
-    mappings: dict[str | StorageType, type[Repository]] = {
-        StorageType.TEXT: TextualRepository,
-        StorageType.BINARY: BinaryRepository,
-    }
-    return mappings.get(kind, TextualRepository)
+    return _MAPPINGS.get(kind, TextualRepository)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from io import BytesIO
 from typing import (
     IO,
     Any,
@@ -11,6 +12,10 @@ from typing import (
 
 from cfinterface.storage import StorageType
 
+# Size, in bytes, of the binary output that is kept in memory before it
+# is handed to the file
+_FLUSH_SIZE = 1024 * 1024
+
 
 class Repository(ABC):
     __slots__ = ["_to", "_wrap_io"]
@@ -36,32 +41,50 @@ class Repository(ABC):
 
 
 class BinaryRepository(Repository):
-    __slots__ = ["_filepointer"]
+    __slots__ = ["_filepointer", "_output"]
 
     def __init__(self, path: str | IO[Any], *args: Any) -> None:
         super().__init__(path)
         self._filepointer: BinaryIO = None  # type: ignore[assignment]
+        self._output: IO[Any] = None  # type: ignore[assignment]
 
     def __enter__(self) -> "BinaryRepository":
-        self._filepointer = (
-            open(self._to, "wb")  # type: ignore[arg-type]
-            if self._wrap_io
-            else self._to  # type: ignore[assignment]
-        )
+        # Binary files are usually made of many small records, so they
+        # are assembled in memory and written to disk in large chunks.
+        if self._wrap_io:
+            self._output = open(self._to, "wb")  # type: ignore[arg-type]
+            self._filepointer = BytesIO()  # type: ignore[assignment]
+        else:
+            self._filepointer = self._to  # type: ignore[assignment]
         super().__enter__()
         return self
 
     def __exit__(self, *args: Any) -> None:
         super().__exit__(*args)
         if self._wrap_io:
+            with self._output:
+                self.__flush()
             self._filepointer.close()
 
+    def __flush(self) -> None:
+        buffer: BytesIO = self._filepointer  # type: ignore[assignment]
+        with buffer.getbuffer() as view:
+            self._output.write(view)
+        buffer.seek(0)
+        buffer.truncate()
+
     def write(self, data: str | bytes) -> None:
         if isinstance(data, bytes):
             self._filepointer.write(data)
+            if self._wrap_io and self._filepointer.tell() >= _FLUSH_SIZE:
+                self.__flush()
 
     @property
     def file(self) -> BinaryIO:
+        # The writers take the file once for each block or register, so
+        # the pending output is handed to the file at these points.
+        if self._wrap_io and self._filepointer.tell() >= _FLUSH_SIZE:
+            self.__flush()
         return self._filepointer
 
 
@@ -96,6 +119,12 @@ class TextualRepository(Repository):
         return self._filepointer
 
 
+_MAPPINGS: dict[str | StorageType, type[Repository]] = {
+    StorageType.TEXT: TextualRepository,
+    StorageType.BINARY: BinaryRepository,
+}
+
+
 @overload
 def factory(kind: Literal["TEXT"]) -> type[TextualRepository]: ...
 
@@ -109,8 +138,4 @@ def factory(kind: str | StorageType) -> type[Repository]: ...
 
 
 def factory(kind: Union[str, "StorageType"]) -> type[Repository]:
-    mappings: dict[str | StorageType, type[Repository]] = {
-        StorageType.TEXT: TextualRepository,
-        StorageType.BINARY: BinaryRepository,
-    }
-    return mappings.get(kind, TextualRepository)
+    return _MAPPINGS.get(kind, TextualRepository)
@@ -1,8 +1,109 @@
+import re
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
 from cfinterface._utils import _is_null
 from cfinterface.components.field import Field
 
+# Regexes of the numeric strptime directives, as built by _strptime,
+# in the order of the datetime arguments they give.
+_NUMERIC_DIRECTIVES = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+}
+_FORMAT_TOKENS = re.compile(r"%(.?)|([^%]+)", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+_parser_cache: dict[str, Callable[[str], datetime | None]] = {}
+# Written dates are often repeated along the rows of a file, so their
+# text is kept in a cache that is emptied when it gets full.
+_FORMAT_CACHE_SIZE = 4096
+_format_cache: dict[tuple[datetime, str], str] = {}
+
+
+def _numeric_regex(fmt: str) -> tuple["re.Pattern[str]", list[str]] | None:
+    pieces: list[str] = []
+    directives: list[str] = []
+    for token in _FORMAT_TOKENS.finditer(fmt):
+        directive, text = token.groups()
+        if text is not None:
+            pieces.append(
+                r"\s+".join(re.escape(part) for part in _WHITESPACE.split(text))
+            )
+        elif directive == "%":
+            pieces.append("%")
+        elif directive in _NUMERIC_DIRECTIVES and directive not in directives:
+            pieces.append(_NUMERIC_DIRECTIVES[directive])
+            directives.append(directive)
+        else:
+            return None
+    if not {"Y", "m", "d"}.issubset(directives):
+        return None
+    names = [d for d in _NUMERIC_DIRECTIVES if d in directives]
+    return re.compile("".join(pieces), re.IGNORECASE), names
+
+
+def _build_parser(fmt: str) -> Callable[[str], datetime | None]:
+    numeric = _numeric_regex(fmt)
+    if numeric is None:
+
+        def parse_strptime(data: str) -> datetime | None:
+            try:
+                return datetime.strptime(data, fmt)
+            except ValueError:
+                return None
+
+        return parse_strptime
+
+    regex, names = numeric
+
+    def parse(data: str) -> datetime | None:
+        match = regex.fullmatch(data)
+        if match is None:
+            return None
+        try:
+            return datetime(*map(int, match.group(*names)))  # type: ignore[arg-type]
+        except ValueError:
+            # Matches the shape, but is not a valid date (e.g. 2024/02/30)
+            return None
+
+    return parse
+
+
+def _parser(fmt: str) -> Callable[[str], datetime | None]:
+    """
+    Returns a function with the same result of ``datetime.strptime`` for
+    a given format, but that returns None instead of raising ValueError
+    when the data does not match it. Formats made only of year, month,
+    day, hour, minute and second are parsed with a cached regex, skipping
+    the locale handling of ``strptime``, which dominates the cost of each
+    call, and text of other shapes is rejected without any exception.
+    """
+    parser = _parser_cache.get(fmt)
+    if parser is None:
+        parser = _build_parser(fmt)
+        _parser_cache[fmt] = parser
+    return parser
+
+
+def _strftime(value: datetime, fmt: str) -> str:
+    # Aware datetimes that are equal may be written differently, so
+    # only naive datetimes are cached
+    if type(value) is not datetime or value.tzinfo is not None:
+        return value.strftime(fmt)
+    key = (value, fmt)
+    text = _format_cache.get(key)
+    if text is None:
+        text = value.strftime(fmt)
+        if len(_format_cache) >= _FORMAT_CACHE_SIZE:
+            _format_cache.clear()
+        _format_cache[key] = text
+    return text
+
 
 class DatetimeField(Field):
     """
@@ -11,7 +112,7 @@ class DatetimeField(Field):
     by an optional argument.
     """
 
-    __slots__ = ["__format"]
+    __slots__ = ["__parsers", "__write_format"]
 
     def __init__(
         self,
@@ -21,62 +122,55 @@ class DatetimeField(Field):
         value: datetime | None = None,
     ) -> None:
         super().__init__(size, starting_position, value)
-        self.__format = format
+        self.__parsers = [
+            _parser(fmt)
+            for fmt in ([format] if isinstance(format, str) else format)
+        ]
+        self.__write_format = format if isinstance(format, str) else format[0]
 
     def _binary_read(self, line: bytes) -> datetime:
-        formats = (
-            [self.__format] if isinstance(self.__format, str) else self.__format
-        )
-        for fmt in formats:
-            try:
-                return datetime.strptime(
-                    line[self._starting_position : self._ending_position]
-                    .decode("utf-8")
-                    .strip(),
-                    fmt,
-                )
-            except ValueError:
-                pass
-        raise ValueError("Could not read datetime")
+        return self.__parse(line[self._slice].decode("utf-8").strip())
 
     def _textual_read(self, line: str) -> datetime:
-        formats = (
-            [self.__format] if isinstance(self.__format, str) else self.__format
-        )
-        for fmt in formats:
-            try:
-                return datetime.strptime(
-                    line[
-                        self._starting_position : self._ending_position
-                    ].strip(),
-                    fmt,
-                )
-            except ValueError:
-                pass
+        return self.__parse(line[self._slice].strip())
+
+    def read_many(self, lines: list[str] | list[bytes]) -> list[Any]:
+        if len(lines) == 0 or isinstance(lines[0], bytes):
+            return super().read_many(lines)
+        fieldslice = self._slice
+        texts = [line[fieldslice].strip() for line in lines]  # type: ignore[union-attr]
+        # Dates are often repeated along the rows, and each distinct
+        # text is parsed only once
+        try:
+            parsed = {text: self.__parse(text) for text in set(texts)}
+        except ValueError:
+            return super().read_many(lines)
+        values = [parsed[text] for text in texts]
+        self._value = values[-1]
+        return values
+
+    def __parse(self, data: str) -> datetime:
+        # The formats are tried in order, and only text that matches
+        # none of them raises
+        for parser in self.__parsers:
+            value = parser(data)
+            if value is not None:
+                return value
         raise ValueError("Could not read datetime")
 
     def _binary_write(self) -> bytes:
-        if self.value is None or _is_null(self.value):
-            return b"".ljust(self.size)
-        else:
-            format = (
-                self.__format
-                if isinstance(self.__format, str)
-                else self.__format[0]
-            )
-            return self.value.strftime(format).ljust(self.size).encode("utf-8")
+        value = self._value
+        # Exact datetimes, the common values, are never null
+        if type(value) is not datetime and (value is None or _is_null(value)):
+            return b" " * self._size
+        text = _strftime(value, self.__write_format)
+        return text.ljust(self._size).encode("utf-8")
 
     def _textual_write(self) -> str:
-        if self.value is None or _is_null(self.value):
-            value = ""
-        else:
-            format = (
-                self.__format
-                if isinstance(self.__format, str)
-                else self.__format[0]
-            )
-            value = self.value.strftime(format)
-        return value.ljust(self._size)
+        value = self._value
+        if type(value) is not datetime and (value is None or _is_null(value)):
+            return " " * self._size
+        return _strftime(value, self.__write_format).ljust(self._size)
 
     @property
     def value(self) -> datetime | None:
@@ -1,7 +1,31 @@
+import sys
+from collections import OrderedDict
 from typing import IO, Any
 
 from cfinterface.components.block import Block
 
+# Comment and separator lines are often repeated many times in a file,
+# so short lines are interned to be stored only once. Bytes lines are
+# kept in a cache of the most recently seen lines.
+_INTERN_MAX_LENGTH = 128
+_BYTES_CACHE_SIZE = 4096
+_bytes_cache: OrderedDict[bytes, bytes] = OrderedDict()
+
+
+def _intern(data: str | bytes) -> str | bytes:
+    if len(data) >= _INTERN_MAX_LENGTH:
+        return data
+    if isinstance(data, str):
+        return sys.intern(data)
+    cached = _bytes_cache.get(data)
+    if cached is None:
+        if len(_bytes_cache) >= _BYTES_CACHE_SIZE:
+            _bytes_cache.popitem(last=False)
+        _bytes_cache[data] = data
+        return data
+    _bytes_cache.move_to_end(data)
+    return cached
+
 
 class DefaultBlock(Block):
     """
@@ -17,7 +41,7 @@ class DefaultBlock(Block):
         return bool(self.data == o.data)
 
     def read(self, file: IO[Any], *args: Any, **kwargs: Any) -> bool:
-        self.data = file.readline()
+        self.data = _intern(file.readline())
         return True
 
     def write(self, file: IO[Any], *args: Any, **kwargs: Any) -> bool:
@@ -1,3 +1,4 @@
+import struct
 from abc import abstractmethod
 from typing import Any, TypeVar, overload
 
@@ -10,7 +11,13 @@ class Field:
     in a file.
     """
 
-    __slots__ = ["_size", "_starting_position", "_ending_position", "_value"]
+    __slots__ = [
+        "_size",
+        "_starting_position",
+        "_ending_position",
+        "_slice",
+        "_value",
+    ]
 
     def __init__(
         self,
@@ -21,6 +28,7 @@ class Field:
         self._size = size
         self._starting_position = starting_position
         self._ending_position = size + starting_position
+        self._slice = slice(starting_position, self._ending_position)
         self._value = value
 
     @abstractmethod
@@ -38,15 +46,54 @@ class Field:
     def read(self, line: bytes) -> Any: ...
 
     def read(self, line: _T) -> Any:
+        if isinstance(line, bytes):
+            return self._read_bytes(line)
+        return self._read_str(line)  # type: ignore[arg-type]
+
+    def _read_str(self, line: str) -> Any:
         try:
-            if isinstance(line, bytes):
-                self._value = self._binary_read(line)
-            else:
-                self._value = self._textual_read(line)
-        except ValueError:
+            self._value = self._textual_read(line)
+        except (ValueError, struct.error):
             self._value = None
         return self._value
 
+    def _read_bytes(self, line: bytes) -> Any:
+        try:
+            self._value = self._binary_read(line)
+        except (ValueError, struct.error):
+            self._value = None
+        return self._value
+
+    def read_many(self, lines: list[str] | list[bytes]) -> list[Any]:
+        """
+        Reads the field from a list of lines, returning one value
+        per line. Values that cannot be read are None, as in
+        :meth:`read`, and the field keeps the value of the last line.
+
+        :param lines: The lines to read the field from
+        :type lines: list[str] | list[bytes]
+        :return: The values read from each line
+        :rtype: list[Any]
+        """
+        if len(lines) == 0:
+            return []
+        binary = isinstance(lines[0], bytes)
+        reader = self._binary_read if binary else self._textual_read
+        try:
+            values = [reader(line) for line in lines]  # type: ignore[arg-type]
+        except (ValueError, struct.error):
+            fallback = self._read_bytes if binary else self._read_str
+            return [fallback(line) for line in lines]  # type: ignore[arg-type]
+        self._value = values[-1]
+        return values
+
+    def _binary_dtype(self) -> Any:
+        """
+        The numpy dtype of the field in binary files, when its bytes
+        can be reinterpreted directly as a column of values, or None.
+        """
+        return None
+
     @abstractmethod
     def _binary_write(self) -> bytes:
         raise NotImplementedError
@@ -55,6 +102,13 @@ class Field:
     def _textual_write(self) -> str:
         raise NotImplementedError
 
+    def _format_value(self) -> str:
+        """
+        The text of the field value without the padding to the field
+        size, as used by delimited lines.
+        """
+        return self._textual_write().strip()
+
     @overload
     def write(self, line: str) -> str: ...
 
@@ -66,13 +120,10 @@ class Field:
             value = self._binary_write()
         else:
             value = self._textual_write()
-        if len(line) < self.ending_position:
-            line = line.ljust(self.ending_position)
-        return (
-            line[: self.starting_position]
-            + value
-            + line[self.ending_position :]
-        )
+        # ljust returns the same line when it is already long enough
+        end = self._ending_position
+        line = line.ljust(end)
+        return line[: self._starting_position] + value + line[end:]
 
     @property
     def size(self) -> int:
@@ -89,6 +140,7 @@ class Field:
     @starting_position.setter
     def starting_position(self, val: int) -> None:
         self._starting_position = val
+        self._slice = slice(val, self._ending_position)
 
     @property
     def ending_position(self) -> int:
@@ -97,6 +149,7 @@ class Field:
     @ending_position.setter
     def ending_position(self, val: int) -> None:
         self._ending_position = val
+        self._slice = slice(self._starting_position, val)
 
     @property
     def value(self) -> Any:
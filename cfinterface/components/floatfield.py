@@ -1,8 +1,10 @@
-from math import floor, log10
+import struct
+from math import copysign, floor, log10
+from typing import Any
 
 import numpy as np  # type: ignore[import-untyped]
 
-from cfinterface._utils import _is_null
+from cfinterface._utils import _dtype_struct, _is_null
 from cfinterface.components.field import Field
 
 
@@ -13,7 +15,15 @@ class FloatField(Field):
     by 'F' for fixed point notation and 'E' or 'D' for scientific notation.
     """
 
-    __slots__ = ["__decimal_digits", "__format", "__sep", "__type"]
+    __slots__ = [
+        "__decimal_digits",
+        "__format",
+        "__sep",
+        "__type",
+        "__struct",
+        "__spec",
+        "__last_write",
+    ]
 
     TYPES = {
         2: np.float16,
@@ -39,82 +49,118 @@ class FloatField(Field):
         self.__format = format
         self.__sep = sep
         self.__type = self.__class__.TYPES.get(size, np.float32)
+        self.__struct = _dtype_struct(self.__type)
+        # All notations format the value at the full decimal digits with
+        # the same spec, and "D" values are formatted as "E" first
+        notation = "E" if format.lower() == "d" else format
+        self.__spec = f".{decimal_digits}{notation}"
+        self.__last_write: tuple[float, int, str] = (0.0, -1, "")
 
     def _binary_read(self, line: bytes) -> float:
-        return float(
-            np.frombuffer(
-                line[self._starting_position : self._ending_position],
-                dtype=self.__type,
-                count=1,
-            )[0]
-        )
+        return float(self.__struct.unpack_from(line[self._slice])[0])
 
     def _textual_read(self, line: str) -> float:
         return float(
-            line[self._starting_position : self._ending_position]
+            line[self._slice]
             .replace(self.__sep, ".")
             .replace("D", "E")
             .replace("d", "e")
         )
 
+    def read_many(self, lines: list[str] | list[bytes]) -> list[Any]:
+        if len(lines) == 0 or isinstance(lines[0], bytes) or self.__sep != ".":
+            return super().read_many(lines)
+        # Values with "D" exponents make float() fail and are handled
+        # by the generic reader, which applies the replacements.
+        fieldslice = self._slice
+        try:
+            values = [float(line[fieldslice]) for line in lines]
+        except ValueError:
+            return super().read_many(lines)
+        self._value = values[-1]
+        return values
+
+    def _binary_dtype(self) -> Any:
+        return self.__type
+
     def _binary_write(self) -> bytes:
-        if self.value is None or _is_null(self.value):
-            return np.array([0.0], dtype=self.__type).tobytes()
-        else:
-            return np.array([self._value], dtype=self.__type).tobytes()
+        value = self._value
+        # Exact floats, the common values, are only null when NaN,
+        # which is the only float that differs from itself
+        if type(value) is float:
+            if value != value:
+                value = 0.0
+        elif value is None or _is_null(value):
+            value = 0.0
+        try:
+            return self.__struct.pack(value)
+        except (struct.error, OverflowError):
+            # Values that struct does not convert as numpy does, such
+            # as out of range floats or non-integral numbers
+            return np.array([value], dtype=self.__type).tobytes()
+
+    def _format_value(self) -> str:
+        return self.__format_unpadded().strip()
 
     def _textual_write(self) -> str:
-        value = ""
-        if self.value is not None and not _is_null(self.value):
-            if self.__format.lower() == "e" and self.value != 0:
-                value = "{:.{d}{format}}".format(
-                    round(
-                        self.value,
-                        self.__decimal_digits
-                        - int(floor(log10(abs(self.value)))),
-                    ),
-                    d=self.__decimal_digits,
-                    format=self.__format,
-                )
-                value = value[: self.size]
-            elif self.__format.lower() == "d" and self.value != 0:
-                value = "{:.{d}{format}}".format(
-                    round(
-                        self.value,
-                        self.__decimal_digits
-                        - int(floor(log10(abs(self.value)))),
-                    ),
-                    d=self.__decimal_digits,
-                    format="E",
-                ).replace("E", "D")
-                value = value[: self.size]
-            else:
-                formatting_format = (
-                    "E" if self.__format.lower() == "d" else self.__format
-                )
-                value = "{:.{d}{format}}".format(
-                    round(self.value, self.__decimal_digits),
-                    d=self.__decimal_digits,
-                    format=formatting_format,
-                ).replace("E", self.__format)
-                if len(value) > self._size:
-                    excess = len(value) - self._size
-                    new_d = self.__decimal_digits - excess
-                    if new_d < 0:
-                        new_d = 0
-                    value = "{:.{d}{format}}".format(
-                        round(self.value, new_d),
-                        d=new_d,
-                        format=formatting_format,
-                    ).replace("E", self.__format)
-                    if len(value) > self._size:
-                        new_d = max(0, new_d - 1)
-                        value = "{:.{d}{format}}".format(
-                            round(self.value, new_d),
-                            d=new_d,
-                            format=formatting_format,
-                        ).replace("E", self.__format)
-        return value.rjust(self.size)
+        # Columns often repeat a value along consecutive rows, mostly
+        # zeros, so the last text is reused. The sign of zeros is also
+        # compared, since -0.0 == 0.0 but they are written differently.
+        v = self._value
+        size = self._size
+        if type(v) is not float:
+            return self.__format_unpadded().rjust(size)
+        last, last_size, last_text = self.__last_write
+        if (
+            v == last
+            and size == last_size
+            and (v or copysign(1.0, v) == copysign(1.0, last))
+        ):
+            return last_text
+        text = self.__format_unpadded().rjust(size)
+        self.__last_write = (v, size, text)
+        return text
+
+    def __format_unpadded(self) -> str:
+        v = self._value
+        if type(v) is float:
+            if v != v:
+                return ""
+        elif v is None or _is_null(v):
+            return ""
+        size = self._size
+        digits = self.__decimal_digits
+        fmt = self.__format
+        lower = fmt.lower()
+        spec = self.__spec
+        if lower == "e" and v != 0:
+            value = format(round(v, digits - int(floor(log10(abs(v))))), spec)
+            return value[:size]
+        elif lower == "d" and v != 0:
+            value = format(round(v, digits - int(floor(log10(abs(v))))), spec)
+            return value.replace("E", "D")[:size]
+        # Fixed point values have no exponent letter to replace, and
+        # most of them fit the field at the full decimal digits. The
+        # "f" spec rounds exact floats as round() does, while other
+        # numbers, such as numpy scalars, are rounded by their type.
+        if lower == "f":
+            value = format(v if type(v) is float else round(v, digits), spec)
+        else:
+            value = format(round(v, digits), spec).replace("E", fmt)
+        if len(value) <= size:
+            return value
+        notation = "E" if lower == "d" else fmt
+        excess = len(value) - size
+        new_d = digits - excess
+        if new_d < 0:
+            new_d = 0
+        value = format(round(v, new_d), f".{new_d}{notation}").replace("E", fmt)
+        if len(value) > size:
+            new_d = max(0, new_d - 1)
+            value = format(round(v, new_d), f".{new_d}{notation}").replace(
+                "E", fmt
+            )
+        return value
 
     @property
     def value(self) -> float | None:
@@ -1,6 +1,9 @@
+import struct
+from typing import Any
+
 import numpy as np  # type: ignore[import-untyped]
 
-from cfinterface._utils import _is_null
+from cfinterface._utils import _dtype_struct, _is_null
 from cfinterface.components.field import Field
 
 
@@ -10,7 +13,7 @@ class IntegerField(Field):
     written to a file.
     """
 
-    __slots__ = ["__type"]
+    __slots__ = ["__type", "__struct"]
 
     TYPES = {
         2: np.int16,
@@ -26,31 +29,50 @@ class IntegerField(Field):
     ) -> None:
         super().__init__(size, starting_position, value)
         self.__type = self.__class__.TYPES.get(size, np.int32)
+        self.__struct = _dtype_struct(self.__type)
 
     def _binary_read(self, line: bytes) -> int:
-        return int(
-            np.frombuffer(
-                line[self._starting_position : self._ending_position],
-                dtype=self.__type,
-                count=1,
-            )[0]
-        )
+        return int(self.__struct.unpack_from(line[self._slice])[0])
 
     def _textual_read(self, line: str) -> int:
-        return int(line[self._starting_position : self._ending_position])
+        return int(line[self._slice])
+
+    def read_many(self, lines: list[str] | list[bytes]) -> list[Any]:
+        if len(lines) == 0 or isinstance(lines[0], bytes):
+            return super().read_many(lines)
+        fieldslice = self._slice
+        try:
+            values = [int(line[fieldslice]) for line in lines]
+        except ValueError:
+            return super().read_many(lines)
+        self._value = values[-1]
+        return values
+
+    def _binary_dtype(self) -> Any:
+        return self.__type
 
     def _binary_write(self) -> bytes:
-        if self.value is None or _is_null(self.value):
-            return np.array([0], dtype=self.__type).tobytes()
-        else:
-            return np.array([self._value], dtype=self.__type).tobytes()
+        value = self._value
+        # Exact ints, the common values, are never null
+        if type(value) is not int and (value is None or _is_null(value)):
+            value = 0
+        try:
+            return self.__struct.pack(value)
+        except (struct.error, OverflowError):
+            # Values that struct does not convert as numpy does, such
+            # as out of range floats or non-integral numbers
+            return np.array([value], dtype=self.__type).tobytes()
+
+    def _format_value(self) -> str:
+        value = self._value
+        if type(value) is int:
+            return str(value)
+        if value is None or _is_null(value):
+            return ""
+        return str(int(value))
 
     def _textual_write(self) -> str:
-        if self.value is None or _is_null(self.value):
-            value = ""
-        else:
-            value = str(int(self.value))
-        return value.rjust(self.size)
+        return self._format_value().rjust(self._size)
 
     @property
     def value(self) -> int | None:
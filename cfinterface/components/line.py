@@ -1,4 +1,4 @@
-from typing import Any, cast, overload
+from typing import Any, overload
 
 from cfinterface.adapters.components.line.repository import (
     factory,
@@ -19,6 +19,8 @@ class Line:
         "_values",
         "_storage",
         "_repository",
+        "_read",
+        "_write",
         "_size",
     ]
 
@@ -38,6 +40,10 @@ class Line:
 
     def __generate_repository(self) -> None:
         self._repository = factory(self._storage)(self._fields, self._values)
+        # Bound once, since every line of a file is read or written
+        # with the same repository
+        self._read = self._repository.read
+        self._write = self._repository.write
 
     @overload
     def read(self, line: str) -> list[Any]: ...
@@ -46,12 +52,35 @@ class Line:
     def read(self, line: bytes) -> list[Any]: ...
 
     def read(self, line: str | bytes) -> list[Any]:
-        return self._repository.read(line, self._delimiter)
+        return self._read(line, self._delimiter)
+
+    def read_many(self, lines: list[str] | list[bytes]) -> list[list[Any]]:
+        """
+        Reads a list of lines with the same layout, returning the
+        values of each line. Equivalent to calling :meth:`read` for
+        every line, but parses each field over all lines at once.
+
+        :param lines: The lines to be read
+        :type lines: list[str] | list[bytes]
+        :return: The values read from each line
+        :rtype: list[list[Any]]
+        """
+        return self._repository.read_many(lines, self._delimiter)
+
+    def write_many(self, rows: list[list[Any]]) -> list[str] | list[bytes]:
+        """
+        Writes many lines with the same layout, one for each list of
+        values. Equivalent to calling :meth:`write` for every row.
+
+        :param rows: The values of each line to be written
+        :type rows: list[list[Any]]
+        :return: The written lines
+        :rtype: list[str] | list[bytes]
+        """
+        return self._repository.write_many(rows, self._delimiter)
 
     def write(self, values: list[Any]) -> str | bytes:
-        return cast(
-            str | bytes, self._repository.write(values, self._delimiter)
-        )
+        return self._write(values, self._delimiter)  # type: ignore[no-any-return]
 
     @property
     def fields(self) -> list[Field]:
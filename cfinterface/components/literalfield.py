@@ -19,27 +19,31 @@ class LiteralField(Field):
         super().__init__(size, starting_position, value)
 
     def _binary_read(self, line: bytes) -> str:
-        return (
-            line[self._starting_position : self._ending_position]
-            .decode("utf-8")
-            .strip()
-        )
+        return line[self._slice].decode("utf-8").strip()
 
     def _textual_read(self, line: str) -> str:
-        return line[self._starting_position : self._ending_position].strip()
+        return line[self._slice].strip()
 
     def _binary_write(self) -> bytes:
-        if self.value is None or _is_null(self.value):
-            return b"".ljust(self.size)
-        else:
-            return self.value.ljust(self.size).encode("utf-8")
+        value = self._value
+        if type(value) is not str and (value is None or _is_null(value)):
+            return b" " * self._size
+        return value.ljust(self._size).encode("utf-8")
+
+    def _format_value(self) -> str:
+        value = self._value
+        if type(value) is not str and (value is None or _is_null(value)):
+            return ""
+        return str(value).strip()
 
     def _textual_write(self) -> str:
-        if self.value is None or _is_null(self.value):
-            value = ""
-        else:
-            value = str(self.value)
-        return value.ljust(self._size)
+        value = self._value
+        # Exact strings, the common values, are never null
+        if type(value) is str:
+            return value.ljust(self._size)
+        if value is None or _is_null(value):
+            return " " * self._size
+        return str(value).ljust(self._size)
 
     @property
     def value(self) -> str | None:
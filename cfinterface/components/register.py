@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import inspect
-from typing import IO, Any, overload
+from typing import IO, Any, ClassVar, overload
 
 from cfinterface.adapters.components.repository import factory
 from cfinterface.components.field import Field
@@ -18,7 +18,6 @@ class Register:
 
     __slots__ = [
         "__data",
-        "__identifier_field",
         "_container",
         "_index",
         "__previous_fallback",
@@ -37,6 +36,13 @@ class Register:
         "previous",
         "custom_properties",
     ]
+    # Lines with the identifier and the fields of the class, for each
+    # storage, which are built once and shared by all its registers,
+    # with the line used for reading the register data. Each class keeps
+    # its own cache, so that it is released together with the class.
+    _lines_cache: ClassVar[
+        dict[Any, tuple[Line, int, list[Field], Any, Line, Line]]
+    ]
 
     def __init__(
         self,
@@ -44,9 +50,6 @@ class Register:
         next: Any | None = None,
         data: Any | None = None,
     ) -> None:
-        self.__identifier_field: Field = LiteralField(
-            self.__class__.IDENTIFIER_DIGITS, 0
-        )
         self._container = None
         self._index = 0
         self.__previous_fallback = previous
@@ -77,6 +80,50 @@ class Register:
             cls.IDENTIFIER, line[: cls.IDENTIFIER_DIGITS]
         )
 
+    @classmethod
+    def _lines(cls, storage: str | StorageType) -> tuple[Line, Line]:
+        cache = cls.__dict__.get("_lines_cache")
+        if cache is None:
+            cache = {}
+            cls._lines_cache = cache
+        cached = cache.get(storage)
+        # The lines are built again if LINE was replaced in the class, or
+        # if its fields, its delimiter or the identifier size changed
+        template = cls.LINE
+        if (
+            cached is None
+            or cached[0] is not template
+            or cached[1] != cls.IDENTIFIER_DIGITS
+            or cached[2] != template.fields
+            or cached[3] != template.delimiter
+        ):
+            line = Line(
+                [LiteralField(cls.IDENTIFIER_DIGITS, 0)] + template.fields,
+                delimiter=template.delimiter,
+                storage=storage,
+            )
+            # Positional fields are read without the identifier, which
+            # is only needed as the first token of delimited lines
+            data_line = (
+                line
+                if template.delimiter is not None
+                else Line(template.fields, storage=storage)
+            )
+            cached = (
+                template,
+                cls.IDENTIFIER_DIGITS,
+                list(template.fields),
+                template.delimiter,
+                line,
+                data_line,
+            )
+            cache[storage] = cached
+        return cached[4], cached[5]
+
+    @classmethod
+    def _line(cls, storage: str | StorageType) -> Line:
+        return cls._lines(storage)[0]
+
     def read(
         self,
         file: IO[Any],
@@ -84,14 +131,11 @@ class Register:
         *args: Any,
         **kwargs: Any,
     ) -> bool:
-        line = Line(
-            [self.__identifier_field] + self.__class__.LINE.fields,
-            delimiter=self.__class__.LINE.delimiter,
-            storage=storage,
-        )
-        self.data = line.read(
+        line, data_line = self._lines(storage)
+        data = data_line.read(
             factory(storage).read(file, self.IDENTIFIER_DIGITS + line.size)
-        )[1:]
+        )
+        self.data = data if data_line is not line else data[1:]
         return True
 
     def write(
@@ -102,11 +146,7 @@ class Register:
         **kwargs: Any,
     ) -> bool:
         if not self.empty:
-            line = Line(
-                [self.__identifier_field] + self.__class__.LINE.fields,
-                delimiter=self.__class__.LINE.delimiter,
-                storage=storage,
-            )
+            line = self._line(storage)
             linedata = line.write([self.__class__.IDENTIFIER] + self.data)
             factory(storage).write(file, linedata)
         return True
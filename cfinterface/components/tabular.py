@@ -1,6 +1,6 @@
-import re
 from typing import IO, Any, NamedTuple, cast
 
+from cfinterface.adapters.components.repository import TextualRepository
 from cfinterface.components.field import Field
 from cfinterface.components.line import Line
 from cfinterface.components.section import Section
@@ -64,14 +64,19 @@ class TabularParser:
         length.
         """
         names = [col.name for col in self._columns]
+        try:
+            rows = self._line.read_many(lines)
+        except Exception:
+            rows = []
+            for line in lines:
+                try:
+                    values: list[Any] = self._line.read(line)
+                except Exception:
+                    values = [None] * len(self._columns)
+                rows.append(values)
         result: dict[str, list[Any]] = {name: [] for name in names}
-        for line in lines:
-            try:
-                values: list[Any] = self._line.read(line)
-            except Exception:
-                values = [None] * len(self._columns)
-            for name, val in zip(names, values, strict=False):
-                result[name].append(val)
+        for name, column in zip(names, zip(*rows, strict=True), strict=False):
+            result[name] = list(column)
         return result
 
     def format_rows(self, data: dict[str, list[Any]]) -> list[str]:
@@ -83,11 +88,8 @@ class TabularParser:
         """
         names = [col.name for col in self._columns]
         n_rows = len(next(iter(data.values()))) if data else 0
-        result: list[str] = []
-        for i in range(n_rows):
-            values = [data[name][i] for name in names]
-            result.append(cast(str, self._line.write(values)))
-        return result
+        rows = [[data[name][i] for name in names] for i in range(n_rows)]
+        return cast(list[str], self._line.write_many(rows))
 
     @staticmethod
     def to_dataframe(data: dict[str, list[Any]]) -> "pd.DataFrame":  # type: ignore[name-defined]  # noqa: F821
@@ -154,12 +156,14 @@ class TabularSection(Section):
 
         lines: list[str] = []
         end_pattern = self.__class__.END_PATTERN
+        # Literal end patterns are checked without building Match objects
+        matches = TextualRepository.matches
         while True:
             pos = file.tell()
             line = file.readline()
             if line == "" or len(line) <= 1:
                 break
-            if end_pattern and re.search(end_pattern, line):
+            if end_pattern and matches(end_pattern, line):
                 file.seek(pos)
                 break
             lines.append(line)
@@ -168,11 +172,13 @@ class TabularSection(Section):
         return True
 
     def write(self, file: IO[Any], *args: Any, **kwargs: Any) -> bool:
-        for header in self._headers:
-            file.write(header)
+        lines = list(self._headers)
         if self.data is not None:
-            for line in self._parser.format_rows(self.data):
-                file.write(line)
+            lines += self._parser.format_rows(self.data)
+        # Joining the lines for a single write is much cheaper than
+        # writing each line of the table
+        if lines:
+            file.write(lines[0][:0].join(lines))
         return True
 
     def __eq__(self, o: object) -> bool:
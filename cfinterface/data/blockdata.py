@@ -46,11 +46,31 @@ class BlockData:
             self._items[i]._index = i
 
     def _index_of(self, item: Block) -> int:
+        idx = item._index
+        if (
+            item._container is self
+            and idx < len(self._items)
+            and self._items[idx] is item
+        ):
+            return idx
         for i, b in enumerate(self._items):
             if b is item:
                 return i
         raise ValueError("Block not found in container")
 
+    def _remove_many(self, items: list[Any]) -> None:
+        removed = {id(b) for b in items}
+        kept: list[Block] = []
+        for b in self._items:
+            if id(b) in removed:
+                b._container = None
+                b._index = 0
+            else:
+                kept.append(b)
+        self._items = kept
+        self._refresh_indices(0)
+        self._rebuild_type_index()
+
     def _rebuild_type_index(self) -> None:
         self._type_index = {}
         for i, item in enumerate(self._items):
@@ -184,9 +204,9 @@ class BlockData:
         if isinstance(filtered_blocks, t):
             self.remove(cast(Block, filtered_blocks))
         elif isinstance(filtered_blocks, list):
-            for b in filtered_blocks:
-                if b is not self._items[0]:
-                    self.remove(cast(Block, b))
+            self._remove_many(
+                [b for b in filtered_blocks if b is not self._items[0]]
+            )
 
     @property
     def first(self) -> Block:
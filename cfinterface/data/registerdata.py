@@ -46,11 +46,31 @@ class RegisterData:
             self._items[i]._index = i
 
     def _index_of(self, item: Register) -> int:
+        idx = item._index
+        if (
+            item._container is self
+            and idx < len(self._items)
+            and self._items[idx] is item
+        ):
+            return idx
         for i, r in enumerate(self._items):
             if r is item:
                 return i
         raise ValueError("Register not found in container")
 
+    def _remove_many(self, items: list[Any]) -> None:
+        removed = {id(r) for r in items}
+        kept: list[Register] = []
+        for r in self._items:
+            if id(r) in removed:
+                r._container = None
+                r._index = 0
+            else:
+                kept.append(r)
+        self._items = kept
+        self._refresh_indices(0)
+        self._rebuild_type_index()
+
     def _rebuild_type_index(self) -> None:
         self._type_index = {}
         for i, item in enumerate(self._items):
@@ -184,9 +204,9 @@ class RegisterData:
         if isinstance(filtered_registers, t):
             self.remove(cast(Register, filtered_registers))
         elif isinstance(filtered_registers, list):
-            for r in filtered_registers:
-                if r is not self._items[0]:
-                    self.remove(cast(Register, r))
+            self._remove_many(
+                [r for r in filtered_registers if r is not self._items[0]]
+            )
 
     @property
     def first(self) -> Register:
@@ -46,11 +46,31 @@ class SectionData:
             self._items[i]._index = i
 
     def _index_of(self, item: Section) -> int:
+        idx = item._index
+        if (
+            item._container is self
+            and idx < len(self._items)
+            and self._items[idx] is item
+        ):
+            return idx
         for i, s in enumerate(self._items):
             if s is item:
                 return i
         raise ValueError("Section not found in container")
 
+    def _remove_many(self, items: list[Any]) -> None:
+        removed = {id(s) for s in items}
+        kept: list[Section] = []
+        for s in self._items:
+            if id(s) in removed:
+                s._container = None
+                s._index = 0
+            else:
+                kept.append(s)
+        self._items = kept
+        self._refresh_indices(0)
+        self._rebuild_type_index()
+
     def _rebuild_type_index(self) -> None:
         self._type_index = {}
         for i, item in enumerate(self._items):
@@ -184,9 +204,9 @@ class SectionData:
         if isinstance(filtered_sections, t):
             self.remove(cast(Section, filtered_sections))
         elif isinstance(filtered_sections, list):
-            for s in filtered_sections:
-                if s is not self._items[0]:
-                    self.remove(cast(Section, s))
+            self._remove_many(
+                [s for s in filtered_sections if s is not self._items[0]]
+            )
 
     @property
     def first(self) -> Section:
@@ -1,9 +1,15 @@
+from inspect import getattr_static
 from os.path import isfile
 from typing import Any
 
-from cfinterface.adapters.reading.repository import Repository, factory
+from cfinterface.adapters.components.repository import MultiPatternRepository
+from cfinterface.adapters.reading.repository import (
+    Repository,
+    TextualRepository,
+    factory,
+)
 from cfinterface.components.block import Block
-from cfinterface.components.defaultblock import DefaultBlock
+from cfinterface.components.defaultblock import DefaultBlock, _intern
 from cfinterface.data.blockdata import BlockData
 from cfinterface.storage import StorageType
 
@@ -16,10 +22,10 @@ class BlockReading:
     __slots__ = [
         "__allowed_blocks",
         "__data",
-        "__last_position_filepointer",
         "__storage",
         "__linesize",
         "__repository",
+        "__begin_patterns",
     ]
 
     def __init__(
@@ -30,34 +36,52 @@ class BlockReading:
     ) -> None:
         self.__allowed_blocks = allowed_blocks
         self.__data = BlockData(DefaultBlock(data=""))
-        self.__last_position_filepointer = 0
         self.__storage = storage
         self.__repository: Repository = None  # type: ignore
         self.__linesize = linesize
-
-    def __read_line_with_backup(self) -> str | bytes:
-        self.__last_position_filepointer = self.__repository.file.tell()
-        return self.__repository.read(self.__linesize)
-
-    def __restore_previous_line(self) -> None:
-        self.__repository.file.seek(self.__last_position_filepointer)
+        self.__begin_patterns: MultiPatternRepository | None = None
+        # Blocks that override begins(), in any form, keep the per-block
+        # search, so the default matcher is looked up without binding it
+        begins = Block.__dict__["begins"]
+        if all(getattr_static(b, "begins") is begins for b in allowed_blocks):
+            self.__begin_patterns = MultiPatternRepository(
+                [b.BEGIN_PATTERN for b in allowed_blocks], False
+            )
 
     def __find_starting_block(self, blockdata: str | bytes) -> "type[Block]":
+        if self.__begin_patterns is not None:
+            if isinstance(blockdata, bytes):
+                blockdata = blockdata.decode("utf-8")
+            idx = self.__begin_patterns.first_match(blockdata)
+            return DefaultBlock if idx is None else self.__allowed_blocks[idx]
         for b in self.__allowed_blocks:
             if b.begins(blockdata):
                 return b
         return DefaultBlock
 
     def __read_file(self, *args: Any, **kwargs: Any) -> BlockData:
+        textual = isinstance(self.__repository, TextualRepository)
+        # The methods called for every line are bound once
+        file = self.__repository.file
+        tell = file.tell
+        read = self.__repository.read
+        linesize = self.__linesize
+        find_starting_block = self.__find_starting_block
+        append = self.__data.append
         while True:
-            line = self.__read_line_with_backup()
+            position = tell()
+            line = read(linesize)
             if len(line) == 0:
                 break
-            self.__restore_previous_line()
-            blocktype = self.__find_starting_block(line)
-            block = blocktype()
-            block.read(self.__repository.file, *args, **kwargs)
-            self.__data.append(block)
+            blocktype = find_starting_block(line)
+            if blocktype is DefaultBlock and textual:
+                # The line that was already read is the whole block
+                block: Block = DefaultBlock(data=_intern(line))
+            else:
+                file.seek(position)
+                block = blocktype()
+                block.read(file, *args, **kwargs)
+            append(block)
         return self.__data
 
     def read(
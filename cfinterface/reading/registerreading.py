@@ -1,7 +1,13 @@
+from inspect import getattr_static
 from os.path import isfile
 from typing import Any
 
-from cfinterface.adapters.reading.repository import Repository, factory
+from cfinterface.adapters.components.repository import MultiPatternRepository
+from cfinterface.adapters.reading.repository import (
+    Repository,
+    TextualRepository,
+    factory,
+)
 from cfinterface.components.defaultregister import DefaultRegister
 from cfinterface.components.register import Register
 from cfinterface.data.registerdata import RegisterData
@@ -20,6 +26,8 @@ class RegisterReading:
         "__storage",
         "__linesize",
         "__repository",
+        "__identifiers",
+        "__identifier_digits",
     ]
 
     def __init__(
@@ -34,6 +42,23 @@ class RegisterReading:
         self.__storage = storage
         self.__repository: Repository = None  # type: ignore
         self.__linesize = linesize
+        self.__identifiers: MultiPatternRepository | None = None
+        self.__identifier_digits = 0
+        digits = {r.IDENTIFIER_DIGITS for r in allowed_registers}
+        # Registers that override matches(), in any form, keep the
+        # per-register search, so the default matcher is looked up
+        # without binding it
+        matches = Register.__dict__["matches"]
+        if len(digits) == 1 and all(
+            getattr_static(r, "matches") is matches for r in allowed_registers
+        ):
+            # The identifiers are compiled once, as bytes patterns for
+            # binary files, instead of being looked up for every line
+            self.__identifier_digits = digits.pop()
+            self.__identifiers = MultiPatternRepository(
+                [r.IDENTIFIER for r in allowed_registers],
+                storage == StorageType.BINARY,
+            )
 
     def __read_line_with_backup(self) -> str | bytes:
         self.__last_position_filepointer = self.__repository.file.tell()
@@ -45,22 +70,38 @@ class RegisterReading:
     def __find_starting_register(
         self, registerdata: str | bytes
     ) -> "type[Register]":
+        if self.__identifiers is not None:
+            identifier = registerdata[: self.__identifier_digits]
+            if self.__storage == StorageType.BINARY:
+                if isinstance(identifier, str):
+                    identifier = identifier.encode("utf-8")
+            elif isinstance(identifier, bytes):
+                identifier = identifier.decode("utf-8")
+            idx = self.__identifiers.first_match(identifier)
+            if idx is None:
+                return DefaultRegister
+            return self.__allowed_registers[idx]
         for r in self.__allowed_registers:
             if r.matches(registerdata, self.__storage):
                 return r
         return DefaultRegister
 
     def __read_file(self, *args: Any, **kwargs: Any) -> RegisterData:
+        textual = isinstance(self.__repository, TextualRepository)
         while True:
             line = self.__read_line_with_backup()
             if len(line) == 0:
                 break
-            self.__restore_previous_line()
             registertype = self.__find_starting_register(line)
-            register = registertype()
-            register.read(
-                self.__repository.file, self.__storage, *args, **kwargs
-            )
+            if registertype is DefaultRegister and textual:
+                # The line that was already read is the whole register
+                register: Register = DefaultRegister(data=line)
+            else:
+                self.__restore_previous_line()
+                register = registertype()
+                register.read(
+                    self.__repository.file, self.__storage, *args, **kwargs
+                )
             self.__data.append(register)
         return self.__data
 
@@ -1,7 +1,11 @@
 from os.path import isfile
 from typing import Any
 
-from cfinterface.adapters.reading.repository import Repository, factory
+from cfinterface.adapters.reading.repository import (
+    Repository,
+    TextualRepository,
+    factory,
+)
 from cfinterface.components.defaultsection import DefaultSection
 from cfinterface.components.section import Section
 from cfinterface.data.sectiondata import SectionData
@@ -47,13 +51,18 @@ class SectionReading:
             section = sectiontype()
             section.read(self.__repository.file, *args, **kwargs)
             self.__data.append(section)
+        textual = isinstance(self.__repository, TextualRepository)
         while True:
             line = self.__read_line_with_backup()
             if len(line) == 0:
                 break
-            self.__restore_previous_line()
-            section = DefaultSection()
-            section.read(self.__repository.file, *args, **kwargs)
+            if textual:
+                # The line that was already read is the whole section
+                section = DefaultSection(data=line)
+            else:
+                self.__restore_previous_line()
+                section = DefaultSection()
+                section.read(self.__repository.file, *args, **kwargs)
             self.__data.append(section)
         return self.__data
 
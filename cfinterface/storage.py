@@ -15,6 +15,11 @@ class StorageType(str, Enum):
     TEXT = "TEXT"
     BINARY = "BINARY"
 
+    # Members are hashed as their str values, which keeps the hash
+    # consistent with str equality and lets dict lookups keyed by the
+    # storage, as the repository factories do, skip Enum.__hash__.
+    __hash__ = str.__hash__
+
 
 def _ensure_storage_type(
     value: Union[str, "StorageType"],
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from cfinterface._utils import _dtype_struct
+from cfinterface.components.integerfield import IntegerField
+
+
+@pytest.mark.parametrize(
+    "dtype,value",
+    [
+        (np.int16, -123),
+        (np.int32, 123456),
+        (np.int64, -(2**40)),
+        (np.float16, 1.5),
+        (np.float32, 0.25),
+        (np.float64, 1e-300),
+    ],
+)
+def test_dtype_struct_matches_numpy_layout(dtype, value):
+    s = _dtype_struct(dtype)
+    data = np.array([value], dtype=dtype).tobytes()
+    assert s.size == len(data)
+    assert s.unpack(data)[0] == value
+
+
+def test_dtype_struct_is_shared():
+    assert _dtype_struct(np.int32) is _dtype_struct(np.int32)
+    f1, f2 = IntegerField(4, 0), IntegerField(4, 4)
+    assert f1._IntegerField__struct is f2._IntegerField__struct
@@ -61,3 +61,11 @@ def test_is_null_numpy_int():
 def test_is_null_pandas_nat():
     pd = pytest.importorskip("pandas")
     assert _is_null(pd.NaT) is True
+
+
+def test_is_null_datetime_subclass_sentinel():
+    class _NullDatetime(datetime):
+        def strftime(self, fmt):
+            raise ValueError("null")
+
+    assert _is_null(_NullDatetime(2024, 1, 1)) is True
@@ -2,9 +2,17 @@ from cfinterface.adapters.components.line.repository import (
     BinaryRepository,
     TextualRepository,
 )
+from cfinterface.components.integerfield import IntegerField
 from cfinterface.components.literalfield import LiteralField
 
 
+def _rebuild_line(fields, values, line):
+    for field, value in zip(fields, values, strict=True):
+        field.value = value
+        line = field.write(line)
+    return line
+
+
 def test_positionalrepository_read_no_fields():
     repo = TextualRepository([])
     fileline = ""
@@ -86,3 +94,24 @@ def test_binary_repository_write_no_fields_returns_bytes():
     result = repo.write([])
     assert isinstance(result, bytes)
     assert result == b""
+
+
+def test_positionalrepository_write_matches_field_write():
+    layouts = [
+        [IntegerField(4, 2), LiteralField(6, 8), IntegerField(3, 20)],
+        [LiteralField(6, 7), LiteralField(6, 0)],
+        [LiteralField(6, 0), LiteralField(6, 3)],
+        [IntegerField(2, 0), LiteralField(3, 2)],
+    ]
+    values = [[12, "abc", 7], ["world!", "hello,"], ["aaaaaa", "bbb"]]
+    values.append([123, "x"])
+    for fields, vals in zip(layouts, values, strict=True):
+        expected = _rebuild_line(fields, vals, "")
+        assert TextualRepository(fields).write(vals) == expected + "\n"
+        expected = _rebuild_line(fields, vals, b"")
+        assert BinaryRepository(fields).write(vals) == expected
+
+
+def test_line_repositories_have_no_instance_dict():
+    assert not hasattr(TextualRepository([]), "__dict__")
+    assert not hasattr(BinaryRepository([]), "__dict__")
@@ -1,6 +1,14 @@
 import re
 
-from cfinterface.adapters.components.repository import _compile, _pattern_cache
+from cfinterface.adapters.components.repository import (
+    MultiPatternRepository,
+    _compile,
+    _compile_typed,
+    _is_literal,
+    _pattern_cache,
+    _search,
+    _typed_pattern_cache,
+)
 
 
 def test_compile_caches_pattern():
@@ -23,3 +31,65 @@ def test_compile_different_patterns():
     p2 = _compile("bar")
     assert p1 is not p2
     assert len(_pattern_cache) == 2
+
+
+def test_compile_typed_converts_pattern():
+    _typed_pattern_cache.clear()
+    assert _compile_typed("test", True).pattern == b"test"
+    assert _compile_typed(b"test", False).pattern == "test"
+    assert _compile_typed("test", False).pattern == "test"
+
+
+def test_compile_typed_caches_pattern():
+    _typed_pattern_cache.clear()
+    p1 = _compile_typed("test", True)
+    p2 = _compile_typed("test", True)
+    assert p1 is p2
+    assert len(_typed_pattern_cache) == 1
+
+
+def test_is_literal():
+    assert _is_literal("HIDR  ")
+    assert _is_literal(b"BLOCK-1")
+    assert not _is_literal(r"^\s*X")
+    assert not _is_literal(b"A|B")
+
+
+def test_searcher_literal_and_regex_agree():
+    for pattern in ["beg", "^beg", "b.g", "xyz"]:
+        for line in ["beg", " begin", "bag", ""]:
+            expected = re.search(pattern, line) is not None
+            assert _search(pattern, line, False) is expected
+            assert _search(pattern, line.encode("utf-8"), True) is expected
+
+
+def test_multipattern_returns_first_pattern_in_order():
+    repo = MultiPatternRepository(["world", "hello", "l+o"], False)
+    assert repo.first_match("hello world") == 0
+    assert repo.first_match("say hello") == 1
+    assert repo.first_match("lllo") == 2
+    assert repo.first_match("nothing") is None
+
+
+def test_multipattern_binary():
+    repo = MultiPatternRepository([b"END", "BEG"], True)
+    assert repo.first_match(b"  BEG") == 1
+    assert repo.first_match(b"END BEG") == 0
+    assert repo.first_match(b"  ") is None
+
+
+def test_multipattern_independent_patterns():
+    repo = MultiPatternRepository([r"(a)\1", "(?P<x>b)", "(?P<x>c)"], False)
+    assert repo.first_match("xaa") == 0
+    assert repo.first_match("c") == 2
+    assert repo.first_match("") is None
+
+
+def test_multipattern_literals_use_substring_search():
+    repo = MultiPatternRepository(["END", b"BEG"], False)
+    assert repo._literals == ["END", "BEG"]
+    assert repo.first_match("BEG END") == 0
+    assert repo.first_match("  BEG") == 1
+    assert repo.first_match("") is None
+    assert MultiPatternRepository(["END"], True)._literals is None
+    assert MultiPatternRepository([], False).first_match("x") is None
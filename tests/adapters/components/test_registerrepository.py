@@ -26,3 +26,26 @@ def test_binary_matches_bytes_pattern_no_match():
 
 def test_binary_matches_str_pattern_no_match():
     assert BinaryRepository.matches(r"xyz", b"hello, world!") is False
+
+
+def test_textual_matches_bytes_pattern():
+    assert TextualRepository.matches(rb"h\w+o", "hello, world!") is True
+    assert TextualRepository.matches(b"xyz", b"hello, world!") is False
+
+
+def test_matches_mixed_line_types():
+    assert BinaryRepository.matches(b"hello", "hello, world!") is True
+    assert BinaryRepository.matches(r"h.llo", "hello, world!") is True
+    assert TextualRepository.matches(r"h.llo", b"hello, world!") is True
+
+
+def test_begins_ends_mixed_line_types():
+    assert BinaryRepository.begins("beg", "  beg") is True
+    assert BinaryRepository.ends(b"end", "  beg") is False
+    assert TextualRepository.begins(b"beg", b"  beg") is True
+    assert TextualRepository.ends("end", b"  end") is True
+
+
+def test_binary_matches_str_pattern_non_utf8_line():
+    assert BinaryRepository.matches(r"UH\s+", b"UH  \xff\xfe") is True
+    assert BinaryRepository.matches("HIDR", b"\xff\xfeUH") is False
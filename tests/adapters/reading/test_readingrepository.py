@@ -0,0 +1,83 @@
+from io import BytesIO, StringIO
+
+from cfinterface.adapters.reading.repository import (
+    BinaryRepository,
+    TextualRepository,
+)
+
+
+def test_textual_repository_reads_file_in_memory(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"first\r\nsecond\r\n")
+    with TextualRepository(str(path)) as repo:
+        assert repo.read(1) == "first\n"
+        pos = repo.file.tell()
+        assert repo.read(1) == "second\n"
+        repo.file.seek(pos)
+        assert repo.read(1) == "second\n"
+        assert repo.read(1) == ""
+
+
+def test_binary_repository_reads_file_in_memory(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"\x00\x01\x02\x03")
+    with BinaryRepository(str(path)) as repo:
+        assert repo.read(2) == b"\x00\x01"
+        assert repo.file.tell() == 2
+        assert repo.read(4) == b"\x02\x03"
+
+
+def test_binary_repository_random_seeks(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(bytes(range(16)))
+    with BinaryRepository(str(path)) as repo:
+        repo.file.seek(12)
+        assert repo.read(2) == b"\x0c\x0d"
+        repo.file.seek(4)
+        assert repo.read(4) == b"\x04\x05\x06\x07"
+        repo.file.seek(-1, 2)
+        assert repo.read(4) == b"\x0f"
+
+
+def test_repositories_read_empty_file(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    with BinaryRepository(str(path)) as repo:
+        assert repo.read(4) == b""
+    with TextualRepository(str(path)) as repo:
+        assert repo.read(1) == ""
+
+
+def test_binary_repository_read_many(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(bytes(range(16)))
+    with BinaryRepository(str(path)) as repo:
+        repo.read(3)
+        chunks = repo.read_many([(12, 2), (0, 3), (14, 8), (20, 1)])
+        assert chunks == [b"\x0c\x0d", b"\x00\x01\x02", b"\x0e\x0f", b""]
+        assert repo.file.tell() == 3
+
+
+def test_repositories_stream_large_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "cfinterface.adapters.reading.repository._MAX_IN_MEMORY_SIZE", 8
+    )
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"first\r\nsecond\r\n")
+    with TextualRepository(str(path)) as repo:
+        assert not isinstance(repo.file, StringIO)
+        assert repo.read(1) == "first\n"
+        pos = repo.file.tell()
+        assert repo.read(1) == "second\n"
+        repo.file.seek(pos)
+        assert repo.read(1) == "second\n"
+        assert repo.read(1) == ""
+    path = tmp_path / "file.bin"
+    path.write_bytes(bytes(range(16)))
+    with BinaryRepository(str(path)) as repo:
+        assert not isinstance(repo.file, BytesIO)
+        assert repo.read(3) == b"\x00\x01\x02"
+        chunks = repo.read_many([(12, 2), (0, 3), (14, 8), (20, 1)])
+        assert chunks == [b"\x0c\x0d", b"\x00\x01\x02", b"\x0e\x0f", b""]
+        assert repo.file.tell() == 3
+    assert repo.file.closed
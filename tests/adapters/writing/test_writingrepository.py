@@ -0,0 +1,48 @@
+from cfinterface.adapters.writing.repository import (
+    BinaryRepository,
+    TextualRepository,
+)
+
+
+def test_binary_repository_writes_file_on_exit(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"old content")
+    with BinaryRepository(str(path)) as repo:
+        assert path.read_bytes() == b""
+        repo.write(b"\x00\x01")
+        repo.file.write(b"\x02")
+        repo.write("ignored")
+    assert path.read_bytes() == b"\x00\x01\x02"
+
+
+def test_textual_repository_writes_file(tmp_path):
+    path = tmp_path / "file.txt"
+    with TextualRepository(str(path)) as repo:
+        repo.write("hello\n")
+        repo.write(b"ignored")
+    assert path.read_text() == "hello\n"
+
+
+def test_binary_repository_flushes_large_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "cfinterface.adapters.writing.repository._FLUSH_SIZE", 4
+    )
+    path = tmp_path / "file.bin"
+    with BinaryRepository(str(path)) as repo:
+        repo.write(b"\x00\x01\x02")
+        assert repo.file.tell() == 3
+        repo.write(b"\x03\x04")
+        assert repo.file.tell() == 0
+        repo.file.write(b"\x05\x06\x07\x08")
+        assert repo.file.tell() == 0
+        repo.file.write(b"\x09")
+    assert path.read_bytes() == bytes(range(10))
+
+
+def test_binary_repository_writes_output_above_flush_size(tmp_path):
+    path = tmp_path / "file.bin"
+    record = bytes(range(200))
+    with BinaryRepository(str(path)) as repo:
+        for _ in range(10000):
+            repo.file.write(record)
+    assert path.read_bytes() == record * 10000
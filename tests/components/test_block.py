@@ -182,3 +182,20 @@ def test_block_begins_bytes_binary():
 
 def test_block_ends_bytes_binary():
     assert DummyBinaryBlock.ends(b"1data", StorageType.BINARY) is True
+
+
+class DummyRegexBlock(Block):
+    BEGIN_PATTERN = r"b.g"
+    END_PATTERN = r"^end"
+
+
+def test_block_literal_patterns_search_whole_line():
+    assert DummyBlock.begins("  the beg\n") is True
+    assert DummyBlock.ends("  the end\n") is True
+    assert DummyBlock.begins("b.g") is False
+
+
+def test_block_regex_patterns():
+    assert DummyRegexBlock.begins("  big\n") is True
+    assert DummyRegexBlock.ends("end\n") is True
+    assert DummyRegexBlock.ends("  end\n") is False
@@ -103,3 +103,60 @@ def test_datetimefield_write_short_line_binary():
     field = DatetimeField(10, 6, format=format, value=date_data)
     line_after = field.write(b"    ")
     assert date_data == datetime.strptime(line_after.decode()[6:], format)
+
+
+def test_datetimefield_read_numeric_formats():
+    cases = [
+        ("2020-01-10 08:05:09", "%Y-%m-%d %H:%M:%S"),
+        ("10/1/2020", "%d/%m/%Y"),
+        ("20200110", "%Y%m%d"),
+        ("2020  01\t10", "%Y %m %d"),
+        ("2020/01/10 8%", "%Y/%m/%d %H%%"),
+        ("Jan 2020 10", "%b %Y %d"),
+    ]
+    for data, format in cases:
+        field = DatetimeField(len(data), 0, format=format)
+        assert field.read(data) == datetime.strptime(data, format)
+
+
+def test_datetimefield_read_invalid_date():
+    field = DatetimeField(10, 0, format="%Y/%m/%d")
+    assert field.read("2021/02/29") is None
+    assert field.read("2020/13/01") is None
+
+
+def test_datetimefield_read_next_format_after_invalid_date():
+    field = DatetimeField(11, 0, format=["%m/%d/%Y", "%d/%m/%Y", "%b %d %Y"])
+    assert field.read("30/01/2020") == datetime(2020, 1, 30)
+    assert field.read("Jan 30 2020") == datetime(2020, 1, 30)
+    assert field.read("30/30/2020") is None
+
+
+def test_datetimefield_write_repeated_values():
+    field = DatetimeField(10, 0, format=["%d/%m/%Y", "%Y/%m/%d"])
+    for _ in range(2):
+        field.value = datetime(2020, 1, 10)
+        assert field.write("") == "10/01/2020"
+        assert field.write(b"") == b"10/01/2020"
+
+
+def test_datetimefield_read_many():
+    field = DatetimeField(10, 2, format="%Y/%m/%d")
+    lines = ["  2020/01/10\n", "  2020/01/10\n", "  2020/01/11\n"]
+    values = field.read_many(lines)
+    assert values == [
+        datetime(2020, 1, 10),
+        datetime(2020, 1, 10),
+        datetime(2020, 1, 11),
+    ]
+    assert field.value == datetime(2020, 1, 11)
+
+
+def test_datetimefield_read_many_invalid_rows():
+    field = DatetimeField(10, 0, format="%Y/%m/%d")
+    assert field.read_many(["2020/01/10", "not a date"]) == [
+        datetime(2020, 1, 10),
+        None,
+    ]
+    assert field.read_many([b"2020/01/10"]) == [datetime(2020, 1, 10)]
+    assert field.read_many([]) == []
@@ -1,6 +1,9 @@
+from collections import OrderedDict
+from io import BytesIO, StringIO
 from unittest.mock import MagicMock, patch
 
-from cfinterface.components.defaultblock import DefaultBlock
+from cfinterface.components import defaultblock
+from cfinterface.components.defaultblock import DefaultBlock, _intern
 from tests.mocks.mock_open import mock_open
 
 
@@ -32,3 +35,36 @@ def test_default_block_write():
             b.data = data
             b.write_block(fp)
     m().write.assert_called_once_with(data)
+
+
+def test_default_block_read_shares_repeated_lines():
+    separator = "-" * 40 + "\n"
+    fp = StringIO(separator * 2)
+    b1, b2 = DefaultBlock(), DefaultBlock()
+    b1.read(fp)
+    b2.read(fp)
+    assert b1.data is b2.data
+
+
+def test_default_block_read_shares_repeated_binary_lines():
+    fp = BytesIO(b"header\n" * 2)
+    b1, b2 = DefaultBlock(), DefaultBlock()
+    b1.read(fp)
+    b2.read(fp)
+    assert b1.data == b"header\n"
+    assert b1.data is b2.data
+
+
+def test_default_block_binary_line_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(
+        "cfinterface.components.defaultblock._BYTES_CACHE_SIZE", 2
+    )
+    monkeypatch.setattr(
+        "cfinterface.components.defaultblock._bytes_cache", OrderedDict()
+    )
+    lines = [bytes([i]) + b"\n" for i in range(3)]
+    first = _intern(lines[0])
+    _intern(bytes(lines[1]))
+    assert _intern(bytes(lines[0])) is first
+    _intern(bytes(lines[2]))
+    assert list(defaultblock._bytes_cache) == [lines[0], lines[2]]
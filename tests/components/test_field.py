@@ -1,6 +1,15 @@
 import pytest
 
+from cfinterface.adapters.writing.repository import (
+    BinaryRepository,
+    TextualRepository,
+)
+from cfinterface.components.datetimefield import DatetimeField
+from cfinterface.components.defaultblock import DefaultBlock
+from cfinterface.components.defaultregister import DefaultRegister
 from cfinterface.components.field import Field
+from cfinterface.components.floatfield import FloatField
+from cfinterface.components.integerfield import IntegerField
 from cfinterface.components.literalfield import LiteralField
 
 
@@ -67,3 +76,36 @@ def test_write_bytes_content_correct():
     assert isinstance(result, bytes)
     assert len(result) >= 7
     assert result[2:7] == b"ABCDE"
+
+
+def test_read_follows_position_setters():
+    field = LiteralField(5, 0)
+    field.starting_position = 6
+    field.ending_position = 11
+    assert field.read("hello world") == "world"
+
+
+def test_typed_reads_match_read():
+    field = IntegerField(4, 0)
+    assert field._read_str("  12") == field.read("  12") == 12
+    assert field._read_str("  xx") is None
+    assert field._read_bytes(b"\x01") is None
+    assert field.value is None
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Field(10, 0),
+        IntegerField(),
+        FloatField(),
+        LiteralField(),
+        DatetimeField(),
+        DefaultBlock(data="line\n"),
+        DefaultRegister(data=""),
+        BinaryRepository("file.bin"),
+        TextualRepository("file.txt"),
+    ],
+)
+def test_slotted_classes_have_no_instance_dict(obj):
+    assert not hasattr(obj, "__dict__")
@@ -127,6 +127,38 @@ def test_floatfield_write_nan_binary():
     assert len(result) == 4
 
 
+def test_floatfield_write_out_of_range_binary():
+    field = FloatField(4, 0, value=1e40)
+    with np.errstate(over="ignore"):
+        assert field.write(b"") == np.array([np.inf], np.float32).tobytes()
+    field = FloatField(2, 0, value=np.float32(2.5))
+    assert field.write(b"") == np.array([2.5], np.float16).tobytes()
+
+
+def test_floatfield_write_repeated_values():
+    field = FloatField(8, 0, 2, value=0.0)
+    assert field._textual_write() == "    0.00"
+    field.value = -0.0
+    assert field._textual_write() == "   -0.00"
+    field.value = -0.0
+    assert field._textual_write() == "   -0.00"
+    field.size = 6
+    assert field._textual_write() == " -0.00"
+    field.value = 1.5
+    assert field._textual_write() == "  1.50"
+    field.value = 1
+    assert field._textual_write() == "  1.00"
+    field.value = float("nan")
+    assert field._textual_write() == "      "
+
+
+def test_floatfield_write_rounds_ties_as_round():
+    for value in [2.675, 0.125, -1.005, np.float64(0.285), np.float32(1.5)]:
+        field = FloatField(10, 0, 2, value=value)
+        expected = f"{round(value, 2):.2F}".rjust(10)
+        assert field._textual_write() == expected
+
+
 def test_floatfield_write_f_fits_at_full_precision():
     f = FloatField(12, 0, 4, format="F", value=123.4567)
     assert f._textual_write() == "    123.4567"
@@ -161,6 +193,11 @@ def test_floatfield_write_d_zero_case_preserved():
     assert f_lower._textual_write() == "  0.0000d+00"
 
 
+def test_floatfield_write_d_zero_precision_reduction():
+    f = FloatField(8, 0, 4, format="D", value=0.0)
+    assert f._textual_write() == "0.00D+00"
+
+
 def test_floatfield_write_negative_zero():
     f = FloatField(8, 0, 4, format="F", value=-0.0)
     assert f._textual_write() == " -0.0000"
@@ -196,3 +233,16 @@ def test_floatfield_write_fuzz_equivalence():
             f"Mismatch: fmt={fmt} size={size} dec={dec} val={val} "
             f"got={result!r} expected={expected!r}"
         )
+
+
+def test_floatfield_read_many():
+    field = FloatField(8, 2, 2)
+    lines = ["  1234.56 ", "    1.5D2", "   xyz   "]
+    assert field.read_many(lines) == [1234.56, 150.0, None]
+    assert field.read_many(lines[:1]) == [1234.56]
+    assert field.value == 1234.56
+
+
+def test_floatfield_read_many_sep():
+    field = FloatField(5, 0, 2, sep=",")
+    assert field.read_many(["12,50", " 1.50"]) == [12.5, 1.5]
@@ -40,6 +40,11 @@ def test_integerfield_read_binary():
     assert field.value == data
 
 
+def test_integerfield_read_short_binary():
+    field = IntegerField(4, 0)
+    assert field.read(b"12") is None
+
+
 def test_integerfield_write_binary():
     intdata = 12345
     line_before = (
@@ -76,3 +81,19 @@ def test_integerfield_write_nan_binary():
     field = IntegerField(4, 0, value=float("nan"))
     result = field.write(b"")
     assert len(result) == 4
+
+
+def test_integerfield_write_non_integral_binary():
+    field = IntegerField(4, 0, value=3.7)
+    assert field.write(b"") == np.array([3], dtype=np.int32).tobytes()
+    field = IntegerField(8, 0, value=np.int64(-9))
+    assert field.write(b"") == np.array([-9], dtype=np.int64).tobytes()
+
+
+def test_integerfield_read_many():
+    field = IntegerField(4, 1)
+    lines = ["  123", " -45 ", " 1.0 "]
+    assert field.read_many(lines) == [123, -45, None]
+    assert field.read_many(lines[:2]) == [123, -45]
+    assert field.value == -45
+    assert field.read_many([]) == []
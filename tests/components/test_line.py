@@ -1,5 +1,10 @@
+import numpy as np
+
+from cfinterface.components.floatfield import FloatField
+from cfinterface.components.integerfield import IntegerField
 from cfinterface.components.line import Line
 from cfinterface.components.literalfield import LiteralField
+from cfinterface.storage import StorageType
 
 
 def test_line_read_no_fields():
@@ -58,3 +63,107 @@ def test_line_write_with_fields_binary():
     fileline = b"hello, world!"
     outline = line.write(values)
     assert fileline == outline
+
+
+def test_line_read_many_matches_read():
+    fields = [IntegerField(4, 0), FloatField(6, 4, 2), LiteralField(5, 10)]
+    line = Line(fields)
+    filelines = ["   1  1.50hello\n", "  xx  2.50world\n", "   3  3.5 !\n"]
+    expected = [line.read(fl) for fl in filelines]
+    assert line.read_many(filelines) == expected
+    assert line.read_many(filelines)[1] == [None, 2.5, "world"]
+    assert line.values == expected[-1]
+
+
+def test_line_read_many_no_fields():
+    line = Line([])
+    assert line.read_many(["", ""]) == [[], []]
+
+
+def test_line_read_many_delimited():
+    line = Line([LiteralField(6, 0), LiteralField(6, 7)], delimiter=";")
+    assert line.read_many(["hello,;world!", "a;b"]) == [
+        ["hello,", "world!"],
+        ["a", "b"],
+    ]
+
+
+def test_line_write_delimited_unpadded_values():
+    line = Line(
+        [
+            IntegerField(6, 0),
+            FloatField(8, 6, 2),
+            FloatField(10, 14, 2, format="E"),
+            LiteralField(8, 24),
+            IntegerField(4, 32),
+        ],
+        delimiter=";",
+    )
+    assert line.write([12, 1.5, 1500.0, " ab c ", None]) == (
+        "12;1.50;1.50E+03;ab c;\n"
+    )
+
+
+def test_line_read_many_binary():
+    fields = [IntegerField(4, 0), LiteralField(5, 4)]
+    line = Line(fields, storage=StorageType.BINARY)
+    filelines = [
+        np.array([i], dtype=np.int32).tobytes() + b"hello" for i in range(3)
+    ]
+    assert line.read_many(filelines) == [[i, "hello"] for i in range(3)]
+
+
+def test_line_read_many_binary_numeric_columns():
+    fields = [IntegerField(4, 0), FloatField(8, 4), IntegerField(2, 12)]
+    line = Line(fields, storage=StorageType.BINARY)
+    filelines = [
+        np.array([i], dtype=np.int32).tobytes()
+        + np.array([i / 2], dtype=np.float64).tobytes()
+        + np.array([-i], dtype=np.int16).tobytes()
+        for i in range(4)
+    ]
+    expected = [line.read(fl) for fl in filelines]
+    assert line.read_many(filelines) == expected
+    assert expected[3] == [3, 1.5, -3]
+    assert line.values == [3, 1.5, -3]
+
+
+def test_line_read_many_binary_uneven_records():
+    line = Line([IntegerField(4, 0)], storage=StorageType.BINARY)
+    filelines = [np.array([1], dtype=np.int32).tobytes(), b"\x01"]
+    assert line.read_many(filelines) == [[1], [None]]
+
+
+def test_line_read_returns_field_values():
+    line = Line([IntegerField(4, 0), FloatField(6, 4, 2)])
+    values = line.read("  12  1.50")
+    assert values == [12, 1.5]
+    assert values == line.values
+
+
+def test_line_read_delimited_missing_tokens_keep_values():
+    line = Line([IntegerField(4, 0), IntegerField(4, 4)], delimiter=";")
+    assert line.read("1;2") == [1, 2]
+    assert line.read("3") == [3, 2]
+    assert [f.starting_position for f in line.fields] == [0, 0]
+
+
+def test_line_read_many_delimited_numeric():
+    line = Line([IntegerField(4, 0), FloatField(6, 4, 2)], delimiter=";")
+    filelines = ["1; 2.5\n", "x;3.5\n", "4\n"]
+    assert line.read_many(filelines[:2]) == [[1, 2.5], [None, 3.5]]
+    assert line.read_many(filelines) == [[1, 2.5], [None, 3.5], [4, 3.5]]
+
+
+def test_line_write_many_matches_write():
+    line = Line([IntegerField(4, 0), FloatField(6, 4, 2)])
+    rows = [[1, 1.5], [None, 2.25]]
+    assert line.write_many(rows) == [line.write(r) for r in rows]
+
+
+def test_line_storage_change_switches_repository():
+    line = Line([IntegerField(4, 0)])
+    assert line.write([1]) == "   1\n"
+    line.storage = StorageType.BINARY
+    assert line.write([1]) == np.array([1], dtype=np.int32).tobytes()
+    assert line.read(np.array([7], dtype=np.int32).tobytes()) == [7]
@@ -0,0 +1,75 @@
+"""pytest-benchmark tests for Line reading and writing performance."""
+
+import pytest
+
+from cfinterface.components.floatfield import FloatField
+from cfinterface.components.integerfield import IntegerField
+from cfinterface.components.line import Line
+
+
+def _make_line():
+    fields = [IntegerField(5, 5 * i) for i in range(5)] + [
+        FloatField(10, 25 + 10 * i, 3) for i in range(5)
+    ]
+    return Line(fields, delimiter=";")
+
+
+def _make_positional_line():
+    fields = [IntegerField(5, 5 * i) for i in range(5)] + [
+        FloatField(10, 25 + 10 * i, 3) for i in range(5)
+    ]
+    return Line(fields)
+
+
+def _make_lines(n):
+    return [";".join([f" {i} "] * 5 + [" 1.500 "] * 5) + "\n" for i in range(n)]
+
+
+def _read_all(line, filelines):
+    for fileline in filelines:
+        line.read(fileline)
+
+
+@pytest.mark.benchmark
+def test_bench_delimited_read(benchmark):
+    line = _make_line()
+    filelines = _make_lines(100)
+    benchmark.pedantic(
+        _read_all, args=(line, filelines), rounds=10, iterations=100
+    )
+
+
+@pytest.mark.benchmark
+def test_bench_delimited_read_many(benchmark):
+    line = _make_line()
+    filelines = _make_lines(100)
+    benchmark.pedantic(
+        line.read_many, args=(filelines,), rounds=10, iterations=100
+    )
+
+
+def _make_positional_lines(n):
+    return [f"{i:5d}" * 5 + "     1.500" * 5 + "\n" for i in range(n)]
+
+
+def _write_all(line, values):
+    for v in values:
+        line.write(v)
+
+
+@pytest.mark.benchmark
+def test_bench_positional_read(benchmark):
+    line = _make_positional_line()
+    filelines = _make_positional_lines(100)
+    benchmark.pedantic(
+        _read_all, args=(line, filelines), rounds=10, iterations=100
+    )
+
+
+@pytest.mark.benchmark
+def test_bench_positional_write(benchmark):
+    line = _make_positional_line()
+    values = [[i] * 5 + [1.5] * 5 for i in range(100)]
+    benchmark.pedantic(
+        _write_all, args=(line, values), rounds=10, iterations=100
+    )
@@ -1,3 +1,6 @@
+import gc
+import weakref
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
 from cfinterface.components.line import Line
@@ -90,6 +93,74 @@ def test_dummy_register_write():
     m().write.assert_called_once_with(write_data)
 
 
+def test_register_line_is_shared_and_follows_line_changes():
+    class _Register(Register):
+        IDENTIFIER = "reg"
+        IDENTIFIER_DIGITS = 4
+        LINE = Line([LiteralField(5, 4)])
+
+    line = _Register._line("")
+    assert _Register._line("") is line
+    assert _Register._line(StorageType.BINARY) is not line
+    r = _Register()
+    r.read(StringIO("reg hello\n"))
+    assert r.data == ["hello"]
+
+    _Register.LINE = Line([LiteralField(2, 4), LiteralField(3, 6)])
+    assert _Register._line("") is not line
+    r = _Register()
+    r.read(StringIO("reg hello\n"))
+    assert r.data == ["he", "llo"]
+
+
+def test_register_line_follows_in_place_changes():
+    class _Register(Register):
+        IDENTIFIER = "reg"
+        IDENTIFIER_DIGITS = 4
+        LINE = Line([LiteralField(5, 4)])
+
+    line = _Register._line("")
+    _Register.LINE.fields.append(LiteralField(3, 10))
+    assert _Register._line("") is not line
+    r = _Register()
+    r.read(StringIO("reg hello abc\n"))
+    assert r.data == ["hello", "abc"]
+
+    line = _Register._line("")
+    _Register.IDENTIFIER_DIGITS = 3
+    assert _Register._line("") is not line
+    assert _Register._line("").fields[0].size == 3
+
+
+def test_register_lines_are_released_with_the_class():
+    cls = type(
+        "_Register",
+        (Register,),
+        {"IDENTIFIER_DIGITS": 4, "LINE": Line([LiteralField(5, 4)])},
+    )
+    cls._line("")
+    assert "_lines_cache" in cls.__dict__
+    assert "_lines_cache" not in Register.__dict__
+    ref = weakref.ref(cls)
+    del cls
+    gc.collect()
+    assert ref() is None
+
+
+def test_register_positional_data_line_skips_identifier():
+    class _Register(Register):
+        IDENTIFIER = "reg"
+        IDENTIFIER_DIGITS = 4
+        LINE = Line([LiteralField(5, 4), LiteralField(3, 10)])
+
+    line, data_line = _Register._lines("")
+    assert len(line.fields) == 3
+    assert len(data_line.fields) == 2
+    r = _Register()
+    r.read(StringIO("reg hello abc\n"))
+    assert r.data == ["hello", "abc"]
+
+
 def test_dummy_delimiterregister_read():
     data = "Hello, world!"
     filedata = DummyDelimitedRegister.IDENTIFIER + " ;" + data + "\n"
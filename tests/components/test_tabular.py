@@ -157,6 +157,15 @@ def test_parse_lines_malformed_row_count_preserved() -> None:
     assert len(result["b"]) == 3
 
 
+def test_parse_lines_row_raising_filled_with_none() -> None:
+    """A line that makes the reader raise produces a row of None."""
+    parser = _make_integer_parser()
+    lines = ["   1   2", b"\xff\xfe   4", "   5   6"]
+    result = parser.parse_lines(lines)  # type: ignore[arg-type]
+    assert result["a"] == [1, None, 5]
+    assert result["b"] == [2, None, 6]
+
+
 # ---------------------------------------------------------------------------
 # 6. format_rows — basic
 # ---------------------------------------------------------------------------
@@ -450,6 +459,22 @@ def test_tabular_section_end_pattern() -> None:
     assert "TOTAL" in next_line
 
 
+class _RegexEndPatternSection(_EndPatternSection):
+    END_PATTERN = r"^\s*TOT"
+
+
+def test_tabular_section_regex_end_pattern() -> None:
+    """Regex END_PATTERNs keep re.search semantics."""
+    content = ["   1   2\n", "   3 TOT\n", "  TOTAL\n"]
+    f = _build_file(content)
+    sec = _RegexEndPatternSection()
+    sec.read(f)
+
+    assert sec.data is not None
+    assert sec.data["a"] == [1, 3]
+    assert f.readline() == "  TOTAL\n"
+
+
 # ---------------------------------------------------------------------------
 # 15. TabularSection empty data after headers
 # ---------------------------------------------------------------------------
@@ -488,6 +513,28 @@ def test_tabular_section_write_none_data() -> None:
     assert out.getvalue() == "MY HEADER\n"
 
 
+def test_tabular_section_write_single_call() -> None:
+    """write() emits the headers and all rows with one file.write call."""
+    sec = _YearValueSection()
+    sec.read(_build_file(["H\n", "2001    1.25\n", "2002    2.50\n", "\n"]))
+
+    out = io.StringIO()
+    with patch.object(out, "write", wraps=out.write) as write:
+        sec.write(out)
+
+    assert write.call_count == 1
+    assert out.getvalue().startswith("H\n2001")
+    assert out.getvalue().count("\n") == 3
+
+
+def test_tabular_section_write_nothing() -> None:
+    """write() without headers or data does not touch the file."""
+    out = io.StringIO()
+    with patch.object(out, "write", wraps=out.write) as write:
+        _YearValueSection().write(out)
+    assert write.call_count == 0
+
+
 # ---------------------------------------------------------------------------
 # 17. TabularSection header preservation
 # ---------------------------------------------------------------------------
@@ -1,3 +1,5 @@
+import pytest
+
 from cfinterface.components.block import Block
 from cfinterface.data.blockdata import BlockData
 
@@ -147,6 +149,23 @@ def test_blockdata_remove_blocks_of_type_no_filter():
     assert len(bd) == 1
 
 
+def test_blockdata_remove_blocks_of_type_keeps_chain():
+    root = DefaultBlock(data=0)
+    bd = BlockData(root)
+    kept = []
+    removed = []
+    for i in range(6):
+        b = DummyBlock(data=i) if i % 2 else DefaultBlock(data=i)
+        (removed if i % 2 else kept).append(b)
+        bd.append(b)
+    bd.remove_blocks_of_type(DummyBlock)
+    assert list(bd) == [root] + kept
+    assert kept[0].previous is root
+    assert kept[1].next is kept[2]
+    assert all(b._container is None for b in removed)
+    assert len(list(bd.of_type(DummyBlock))) == 0
+
+
 def test_blockdata_getitem():
     root = DummyBlock(data=0)
     bd = BlockData(root)
@@ -291,3 +310,15 @@ def test_blockdata_type_index_after_preppend():
     assert dummy_results[1] is root
     assert bd._type_index[DummyBlock] == [0, 1]
     assert bd._type_index[DefaultBlock] == [2]
+
+
+def test_blockdata_remove_item_from_another_container():
+    d1 = BlockData(DummyBlock(data=-1))
+    d2 = BlockData(DummyBlock(data=-2))
+    item = DummyBlock(data=1)
+    d1.append(item)
+    d2.append(item)
+    with pytest.raises(ValueError):
+        d2.remove(DummyBlock(data=1))
+    d1.remove(item)
+    assert len(d1) == 1
@@ -1,3 +1,5 @@
+import pytest
+
 from cfinterface.components.line import Line
 from cfinterface.components.literalfield import LiteralField
 from cfinterface.components.register import Register
@@ -300,3 +302,15 @@ def test_registerdata_type_index_after_preppend():
     assert dummy_results[1] is root
     assert rd._type_index[DummyRegister] == [0, 1]
     assert rd._type_index[DefaultRegister] == [2]
+
+
+def test_registerdata_remove_item_from_another_container():
+    d1 = RegisterData(DummyRegister(data=-1))
+    d2 = RegisterData(DummyRegister(data=-2))
+    item = DummyRegister(data=1)
+    d1.append(item)
+    d2.append(item)
+    with pytest.raises(ValueError):
+        d2.remove(DummyRegister(data=1))
+    d1.remove(item)
+    assert len(d1) == 1
@@ -1,3 +1,5 @@
+import pytest
+
 from cfinterface.components.section import Section
 from cfinterface.data.sectiondata import SectionData
 
@@ -283,3 +285,15 @@ def test_sectiondata_type_index_after_preppend():
     assert dummy_results[1] is root
     assert sd._type_index[DummySection] == [0, 1]
     assert sd._type_index[DefaultSection] == [2]
+
+
+def test_sectiondata_remove_item_from_another_container():
+    d1 = SectionData(DummySection(data=-1))
+    d2 = SectionData(DummySection(data=-2))
+    item = DummySection(data=1)
+    d1.append(item)
+    d2.append(item)
+    with pytest.raises(ValueError):
+        d2.remove(DummySection(data=1))
+    d1.remove(item)
+    assert len(d1) == 1
@@ -2,6 +2,7 @@ from typing import IO
 from unittest.mock import MagicMock, patch
 
 from cfinterface.components.block import Block
+from cfinterface.components.defaultblock import DefaultBlock
 from cfinterface.reading.blockreading import BlockReading
 from tests.mocks.mock_open import mock_open
 
@@ -73,3 +74,45 @@ def test_blockreading_withdata_frombuffer():
     assert dbs[0].data[0].strip() == DummyBlock.BEGIN_PATTERN
     assert dbs[0].data[1].strip() == data
     assert dbs[0].data[2].strip() == DummyBlock.END_PATTERN
+
+
+class CustomBeginBlock(DummyBlock):
+    BEGIN_PATTERN = "never"
+
+    @classmethod
+    def begins(cls, line, storage=""):
+        return line.startswith("custom")
+
+
+def test_blockreading_custom_begins():
+    filedata = "custom\nend\nbeg\nend\n"
+    br = BlockReading([CustomBeginBlock, DummyBlock])
+    bd = br.read(filedata, "utf-8")
+    assert [type(b) for b in bd][1:] == [CustomBeginBlock, DummyBlock]
+
+
+def test_blockreading_default_blocks_keep_lines():
+    filedata = "comment\nbeg\nx\nend\ntrailing"
+    br = BlockReading([DummyBlock])
+    bd = br.read(filedata, "utf-8")
+    assert [b.data for b in bd.of_type(DefaultBlock)] == [
+        "",
+        "comment\n",
+        "trailing",
+    ]
+    assert bd.last.data == "trailing"
+
+
+class StaticBeginBlock(DummyBlock):
+    BEGIN_PATTERN = "never"
+
+    @staticmethod
+    def begins(line, storage=""):
+        return line.startswith("static")
+
+
+def test_blockreading_static_begins():
+    filedata = "static\nend\nbeg\nend\n"
+    br = BlockReading([StaticBeginBlock, DummyBlock])
+    bd = br.read(filedata, "utf-8")
+    assert [type(b) for b in bd][1:] == [StaticBeginBlock, DummyBlock]
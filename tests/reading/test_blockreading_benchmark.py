@@ -0,0 +1,45 @@
+"""pytest-benchmark tests for BlockReading block dispatch performance."""
+
+from typing import IO
+
+import pytest
+
+from cfinterface.components.block import Block
+from cfinterface.reading.blockreading import BlockReading
+
+
+def _make_blocks(patterns):
+    def read(self, file: IO) -> bool:
+        self.data = file.readline()
+        return True
+
+    return [
+        type(f"Block{i}", (Block,), {"BEGIN_PATTERN": p, "read": read})
+        for i, p in enumerate(patterns)
+    ]
+
+
+def _make_content(n):
+    return "".join(
+        f"  comment line {i} with some text\n"
+        + (f"  MARKER{i % 20:02d} data\n" if i % 10 == 0 else "")
+        for i in range(n)
+    )
+
+
+def _read(blocks, content):
+    BlockReading(blocks).read(content, "utf-8")
+
+
+@pytest.mark.benchmark
+def test_bench_dispatch_literal_patterns(benchmark):
+    blocks = _make_blocks([f"MARKER{i:02d}" for i in range(20)])
+    content = _make_content(2000)
+    benchmark.pedantic(_read, args=(blocks, content), rounds=10, iterations=5)
+
+
+@pytest.mark.benchmark
+def test_bench_dispatch_regex_patterns(benchmark):
+    blocks = _make_blocks([rf"^\s+MARKER{i:02d}\s" for i in range(20)])
+    content = _make_content(2000)
+    benchmark.pedantic(_read, args=(blocks, content), rounds=10, iterations=5)
@@ -1,5 +1,8 @@
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
+from cfinterface.components.integerfield import IntegerField
 from cfinterface.components.line import Line
 from cfinterface.components.literalfield import LiteralField
 from cfinterface.components.register import Register
@@ -46,3 +49,76 @@ def test_registerreading_withdata_frombuffer():
     dbs = [b for b in bd.of_type(DummyRegister)]
     assert len(dbs) == 1
     assert dbs[0].data[0].strip() == data
+
+
+class OtherRegister(Register):
+    IDENTIFIER = "oth"
+    IDENTIFIER_DIGITS = 4
+    LINE = Line([LiteralField(13, 4)])
+
+
+class CustomMatchRegister(OtherRegister):
+    @classmethod
+    def matches(cls, line, storage=""):
+        return line.startswith("cus")
+
+
+def test_registerreading_dispatches_registers_in_order():
+    filedata = "oth a\nreg b\nxre c\n"
+    br = RegisterReading([DummyRegister, OtherRegister])
+    bd = br.read(filedata, "utf-8")
+    assert [type(r).__name__ for r in bd][1:] == [
+        "OtherRegister",
+        "DummyRegister",
+        "DefaultRegister",
+    ]
+
+
+def test_registerreading_custom_matches():
+    filedata = "cus a\nreg b\n"
+    br = RegisterReading([CustomMatchRegister, DummyRegister])
+    bd = br.read(filedata, "utf-8")
+    assert [type(r) for r in bd][1:] == [CustomMatchRegister, DummyRegister]
+
+
+class StaticMatchRegister(OtherRegister):
+    @staticmethod
+    def matches(line, storage=""):
+        return line.startswith("sta")
+
+
+def test_registerreading_static_matches():
+    filedata = "sta a\nreg b\n"
+    br = RegisterReading([StaticMatchRegister, DummyRegister])
+    bd = br.read(filedata, "utf-8")
+    assert [type(r) for r in bd][1:] == [StaticMatchRegister, DummyRegister]
+
+
+class BinaryRegister(Register):
+    IDENTIFIER = b"bin"
+    IDENTIFIER_DIGITS = 4
+    LINE = Line([IntegerField(4, 4)])
+
+
+class OtherBinaryRegister(Register):
+    IDENTIFIER = r"o\w+"
+    IDENTIFIER_DIGITS = 4
+    LINE = Line([IntegerField(4, 4)])
+
+
+def test_registerreading_binary_dispatch():
+    # Binary registers read IDENTIFIER_DIGITS bytes beyond their line
+    def record(identifier: bytes, value: int) -> bytes:
+        return (
+            identifier + np.array([value], dtype=np.int32).tobytes() + bytes(4)
+        )
+
+    filedata = record(b"oth ", 1) + record(b"bin ", 2) + record(b"obin", 3)
+    br = RegisterReading([BinaryRegister, OtherBinaryRegister], "BINARY", 12)
+    bd = br.read(filedata, "utf-8")
+    assert [type(r) for r in bd][1:] == [
+        OtherBinaryRegister,
+        BinaryRegister,
+        BinaryRegister,
+    ]
+    assert [r.data for r in bd][1:] == [[1], [2], [3]]
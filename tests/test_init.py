@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+
+def test_import_does_not_load_pandas():
+    # pandas is an optional dependency, imported only by the methods
+    # that build DataFrames
+    code = "import sys, cfinterface; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -26,3 +26,9 @@ def test_storage_type_import_from_package():
     from cfinterface import StorageType as ST
 
     assert ST.TEXT == "TEXT"
+
+
+def test_storage_type_hash_matches_str():
+    assert hash(StorageType.TEXT) == hash("TEXT")
+    assert {"BINARY": 1}[StorageType.BINARY] == 1
+    assert {StorageType.TEXT: 1}["TEXT"] == 1